@@ -1,16 +1,25 @@
 """Launcher script with dependency checking."""
 
 import sys
-import subprocess
+
+from src._deps import check_all
 
 def check_pyqt6():
     """Check if PyQt6 is working."""
+    # The shared probe reports a missing install without loading Qt's
+    # C extensions.
+    if check_all().qt is None:
+        print("✗ PyQt6 is not installed")
+        print("\nTo fix, run:")
+        print("  pip install PyQt6==6.6.1")
+        return False
+
     try:
-        from PyQt6 import QtCore
-        print("✓ PyQt6 is installed correctly")
+        from src.qt_compat import QT_LIBRARY
+        print(f"✓ {QT_LIBRARY} is installed correctly")
         return True
     except ImportError as e:
-        print(f"✗ PyQt6 import failed: {e}")
+        print(f"✗ Qt import failed: {e}")
         print("\nTo fix, run:")
         print("  pip uninstall PyQt6 PyQt6-Qt6 PyQt6-sip -y")
         print("  pip install PyQt6==6.6.1")
@@ -18,22 +27,20 @@ def check_pyqt6():
 
 def check_graphviz():
     """Check if graphviz is installed."""
-    try:
-        import graphviz
-        print("✓ graphviz Python package is installed")
-    except ImportError:
+    status = check_all()
+
+    if not status.graphviz_package:
         print("✗ graphviz not installed")
         print("  Run: pip install graphviz==0.20.1")
         return False
-    
-    try:
-        subprocess.run(['dot', '-V'], capture_output=True, timeout=5)
+    print("✓ graphviz Python package is installed")
+
+    if status.dot_version is not None:
         print("✓ Graphviz system binary is installed")
         return True
-    except:
-        print("✗ Graphviz system binary not found")
-        print("  Install from: https://graphviz.org/download/")
-        return False
+    print("✗ Graphviz system binary not found")
+    print("  Install from: https://graphviz.org/download/")
+    return False
 
 if __name__ == "__main__":
     print("FSM Visualizer - Dependency Check")
@@ -10,7 +10,14 @@ if project_root not in sys.path:
 
 def main():
     """Run the application."""
+    # One batched probe for every external dependency
+    from src._deps import check_all
+    status = check_all()
+
     try:
+        if status.qt is None:
+            raise ImportError("Neither PyQt6 nor PySide6 is installed")
+
         # Import Qt compatibility layer
         from src.qt_compat import QApplication, QT_LIBRARY
         print(f"Using {QT_LIBRARY} for GUI")
@@ -0,0 +1,88 @@
+"""Shared dependency probing for the launcher entry points.
+
+run.py, launch.py and check_graphviz.py all need the same answers
+(which Qt binding is available, whether the graphviz package and the
+dot binary exist), so the probe lives here and runs at most once per
+process. The dot -V result is additionally cached on disk across
+launches, keyed by the binary's path and mtime.
+"""
+
+import importlib.util
+import json
+import shutil
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+# Cache file for the `dot -V` probe. Spawning `dot` costs ~50ms on
+# Windows; the version string is stable per install.
+_DOT_CACHE_FILE = Path.home() / ".cache" / "fsm_visualizer" / "dot.json"
+
+
+class DepStatus(NamedTuple):
+    """Outcome of the one-shot dependency probe."""
+    qt: Optional[str]           # 'PyQt6', 'PySide6', or None
+    graphviz_package: bool      # graphviz Python bindings importable
+    dot_version: Optional[str]  # `dot -V` output, None if binary missing
+
+
+@lru_cache(maxsize=1)
+def check_all() -> DepStatus:
+    """Probe every external dependency, at most once per process."""
+    qt = next(
+        (name for name in ('PyQt6', 'PySide6')
+         if importlib.util.find_spec(name) is not None),
+        None,
+    )
+
+    graphviz_package = importlib.util.find_spec('graphviz') is not None
+
+    dot_version = None
+    if shutil.which('dot') is not None:
+        try:
+            dot_version = _cached_dot_version()
+        except Exception:
+            dot_version = None
+
+    return DepStatus(qt, graphviz_package, dot_version)
+
+
+def _cached_dot_version() -> Optional[str]:
+    """Return the `dot -V` version string, or None if dot is not on PATH.
+
+    The subprocess result is cached in a small JSON file so repeated
+    launches skip the process spawn entirely. The cache is invalidated
+    when the resolved dot binary or its mtime changes (e.g. after a
+    Graphviz upgrade).
+    """
+    dot_exe = shutil.which('dot')
+    if dot_exe is None:
+        return None
+
+    mtime = Path(dot_exe).stat().st_mtime
+
+    try:
+        cached = json.loads(_DOT_CACHE_FILE.read_text())
+        if cached.get('path') == dot_exe and cached.get('mtime') == mtime:
+            return cached.get('version')
+    except (OSError, ValueError):
+        pass  # Missing or corrupt cache: fall through to the subprocess
+
+    result = subprocess.run(
+        [dot_exe, '-V'],
+        capture_output=True,
+        text=True,
+        timeout=5
+    )
+    version = result.stderr.strip()
+
+    try:
+        _DOT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _DOT_CACHE_FILE.write_text(json.dumps(
+            {'path': dot_exe, 'mtime': mtime, 'version': version}
+        ))
+    except OSError:
+        pass  # Cache is best-effort; never fail the check over it
+
+    return version
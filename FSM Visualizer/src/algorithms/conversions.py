@@ -1,69 +1,64 @@
 """Conversions between Mealy and Moore machines."""
 
+from collections import defaultdict
+
 from models.mealy_moore import MealyMachine, MooreMachine
 
 
 def mealy_to_moore(mealy: MealyMachine) -> MooreMachine:
     """
     Convert a Mealy machine to a Moore machine.
-    
+
     Args:
         mealy: The Mealy machine to convert
-        
+
     Returns:
         Equivalent Moore machine
     """
     moore = MooreMachine()
-    
-    # Create states: for each (state, output) pair in Mealy
+
+    # Invert the output function in a single pass over the transitions:
+    # state -> set of outputs it can be entered with. Each (state, output)
+    # pair becomes one Moore state, deduplicated by the set, instead of
+    # probing every (state, symbol) combination.
+    entry_outputs = defaultdict(set)
+    for trans in mealy.transitions:
+        entry_outputs[trans.to_state].add(trans.output)
+
+    # Create states: for each (state, entry output) pair in Mealy
     # we need a corresponding state in Moore
     state_map = {}
-    
+
     for state in mealy.states:
-        # Find all possible outputs from this state
-        outputs = set()
-        for symbol in mealy.alphabet:
-            if (state, symbol) in mealy.output_function:
-                outputs.add(mealy.output_function[(state, symbol)])
-        
-        # Create Moore states for each output
+        outputs = entry_outputs.get(state)
+
         if not outputs:
-            # No transitions from this state
+            # Never entered by any transition (e.g. an isolated start state)
             moore_state = f"{state}"
-            moore.add_state(moore_state, output=None)
+            moore.add_state(moore_state)
             state_map[(state, None)] = moore_state
         else:
             for output in outputs:
                 moore_state = f"{state}_{output}"
-                moore.add_state(moore_state, output=output)
+                moore.add_state(moore_state)
+                moore.set_state_output(moore_state, output)
                 state_map[(state, output)] = moore_state
-    
-    # Set start state
-    # Find output of first transition from start
-    start_output = None
-    for symbol in mealy.alphabet:
-        if (mealy.start_state, symbol) in mealy.output_function:
-            start_output = mealy.output_function[(mealy.start_state, symbol)]
-            break
-    
+
+    # Set start state: any twin of the Mealy start state will do, since
+    # the entry output of the initial state is unobservable. One lookup
+    # in the inverted map, with (None,) covering the twin-less case.
+    start_output = next(iter(entry_outputs.get(mealy.start_state, (None,))))
     moore.start_state = state_map[(mealy.start_state, start_output)]
-    
-    # Add transitions
-    for (from_state, symbol), to_state in mealy.transitions.items():
-        output = mealy.output_function.get((from_state, symbol))
-        next_output = None
-        
-        # Find output of next state
-        for next_symbol in mealy.alphabet:
-            if (to_state, next_symbol) in mealy.output_function:
-                next_output = mealy.output_function[(to_state, next_symbol)]
-                break
-        
-        moore_from = state_map[(from_state, output)]
-        moore_to = state_map[(to_state, next_output)]
-        
-        moore.add_transition(moore_from, moore_to, symbol)
-    
+
+    # Add transitions: every twin of from_state gets the same outgoing
+    # edge, landing on the twin of to_state tagged with this output
+    for trans in mealy.transitions:
+        moore_to = state_map[(trans.to_state, trans.output)]
+
+        for output in entry_outputs.get(trans.from_state) or (None,):
+            moore_from = state_map[(trans.from_state, output)]
+            moore.add_transition(moore_from, moore_to, trans.symbol)
+
     return moore
 
 
@@ -86,12 +81,14 @@ def moore_to_mealy(moore: MooreMachine) -> MealyMachine:
     # Set start state
     mealy.start_state = moore.start_state
     
-    # Copy transitions and assign outputs based on destination state
-    for (from_state, symbol), to_state in moore.transitions.items():
-        mealy.add_transition(from_state, to_state, symbol)
-        
+    # Copy transitions and assign outputs based on destination state.
+    # The Moore machine's state_outputs dict already is the precomputed
+    # next-state-output map, so each transition is a single lookup.
+    state_outputs = moore.state_outputs
+
+    for trans in moore.transitions:
         # Output is the output of the destination state in Moore
-        output = moore.output_function.get(to_state)
-        mealy.output_function[(from_state, symbol)] = output
-    
+        output = state_outputs.get(trans.to_state)
+        mealy.add_transition(trans.from_state, trans.to_state, trans.symbol, output)
+
     return mealy
\ No newline at end of file
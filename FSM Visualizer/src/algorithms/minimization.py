@@ -1,147 +1,174 @@
-"""DFA minimization using Hopcroft's algorithm."""
-
-from typing import Set, Dict, List, Tuple
-from models.dfa import DFA
-
-
-def minimize_dfa(dfa: DFA) -> DFA:
-    """
-    Minimize a DFA using Hopcroft's algorithm.
-    
-    Args:
-        dfa: The DFA to minimize
-        
-    Returns:
-        Minimized DFA
-    """
-    # Remove unreachable states first
-    reachable = find_reachable_states(dfa)
-    
-    # Initialize partition: accepting and non-accepting states
-    partitions: List[Set[str]] = []
-    
-    accept_states = dfa.accept_states & reachable
-    non_accept_states = reachable - dfa.accept_states
-    
-    if accept_states:
-        partitions.append(accept_states)
-    if non_accept_states:
-        partitions.append(non_accept_states)
-    
-    # Refine partitions
-    changed = True
-    while changed:
-        changed = False
-        new_partitions = []
-        
-        for partition in partitions:
-            # Try to split this partition
-            split = split_partition(dfa, partition, partitions)
-            
-            if len(split) > 1:
-                changed = True
-                new_partitions.extend(split)
-            else:
-                new_partitions.append(partition)
-        
-        partitions = new_partitions
-    
-    # Build minimized DFA
-    return build_minimized_dfa(dfa, partitions)
-
-
-def find_reachable_states(dfa: DFA) -> Set[str]:
-    """Find all states reachable from the start state."""
-    reachable = set()
-    stack = [dfa.start_state]
-    
-    while stack:
-        state = stack.pop()
-        if state in reachable:
-            continue
-        
-        reachable.add(state)
-        
-        for symbol in dfa.alphabet:
-            next_state = dfa.get_transition(state, symbol)
-            if next_state and next_state not in reachable:
-                stack.append(next_state)
-    
-    return reachable
-
-
-def split_partition(dfa: DFA, partition: Set[str], all_partitions: List[Set[str]]) -> List[Set[str]]:
-    """Try to split a partition based on transitions."""
-    if len(partition) <= 1:
-        return [partition]
-    
-    # Group states by their transition signatures
-    signatures: Dict[Tuple, Set[str]] = {}
-    
-    for state in partition:
-        # Create signature: which partition each symbol leads to
-        sig = []
-        for symbol in sorted(dfa.alphabet):
-            next_state = dfa.get_transition(state, symbol)
-            
-            # Find which partition the next state belongs to
-            partition_idx = -1
-            for i, p in enumerate(all_partitions):
-                if next_state in p:
-                    partition_idx = i
-                    break
-            
-            sig.append(partition_idx)
-        
-        sig_tuple = tuple(sig)
-        if sig_tuple not in signatures:
-            signatures[sig_tuple] = set()
-        signatures[sig_tuple].add(state)
-    
-    return list(signatures.values())
-
-
-def build_minimized_dfa(original_dfa: DFA, partitions: List[Set[str]]) -> DFA:
-    """Build a new DFA from partitions."""
-    minimized = DFA()
-    
-    # Create mapping from old states to partition representatives
-    state_map: Dict[str, str] = {}
-    partition_reps: Dict[int, str] = {}
-    
-    for i, partition in enumerate(partitions):
-        # Use first state as representative
-        rep = f"q{i}"
-        partition_reps[i] = rep
-        minimized.add_state(rep)
-        
-        for state in partition:
-            state_map[state] = rep
-            
-            # Check if this is an accept state
-            if state in original_dfa.accept_states:
-                minimized.accept_states.add(rep)
-    
-    # Set start state
-    minimized.start_state = state_map[original_dfa.start_state]
-    
-    # Add transitions (one per partition)
-    added_transitions = set()
-    for partition in partitions:
-        rep_state = state_map[next(iter(partition))]
-        
-        # Use any state from partition to determine transitions
-        sample_state = next(iter(partition))
-        
-        for symbol in original_dfa.alphabet:
-            next_state = original_dfa.get_transition(sample_state, symbol)
-            
-            if next_state:
-                next_rep = state_map[next_state]
-                trans_key = (rep_state, symbol)
-                
-                if trans_key not in added_transitions:
-                    minimized.add_transition(rep_state, next_rep, symbol)
-                    added_transitions.add(trans_key)
-    
+"""DFA minimization using Hopcroft's algorithm."""
+
+from collections import deque
+from typing import Set, Dict, List, Tuple
+from models.dfa import DFA
+
+
+def _hopcroft(inverse: List[List[List[int]]], accept: Set[int],
+              n_states: int, n_symbols: int) -> List[Set[int]]:
+    """Partition-refinement kernel over dense integer state ids.
+
+    Model-free like the subset-construction kernel: it sees only the
+    inverse transition lists and the accepting index set, and returns
+    the final partitions as sets of ints. Refines against (splitter,
+    symbol) pairs, always re-queueing the smaller half of a split —
+    O(n·|Σ|·log n) instead of the O(n²·|Σ|) repeated-split loop.
+    """
+    non_accept = set(range(n_states)) - accept
+    partitions: List[Set[int]] = [p for p in (accept, non_accept) if p]
+
+    worklist = deque(
+        (frozenset(p), sym_idx) for p in partitions for sym_idx in range(n_symbols)
+    )
+
+    while worklist:
+        splitter, sym_idx = worklist.popleft()
+        inv_row = inverse[sym_idx]
+
+        # X = all states whose transition on the symbol lands in the splitter
+        x: Set[int] = set()
+        for dst in splitter:
+            x.update(inv_row[dst])
+
+        if not x:
+            continue
+
+        new_partitions: List[Set[int]] = []
+        for y in partitions:
+            intersection = y & x
+            if not intersection or len(intersection) == len(y):
+                new_partitions.append(y)
+                continue
+
+            difference = y - x
+            new_partitions.append(intersection)
+            new_partitions.append(difference)
+
+            smaller = intersection if len(intersection) <= len(difference) else difference
+            frozen_smaller = frozenset(smaller)
+            for sym in range(n_symbols):
+                worklist.append((frozen_smaller, sym))
+
+        partitions = new_partitions
+
+    return partitions
+
+
+def minimize_dfa(dfa: DFA) -> DFA:
+    """
+    Minimize a DFA using Hopcroft's algorithm.
+
+    Args:
+        dfa: The DFA to minimize
+
+    Returns:
+        Minimized DFA
+    """
+    # Snapshot the transition function into a plain local dict once;
+    # the nested loops below then do pure dict lookups with no method
+    # dispatch per (state, symbol) pair.
+    delta: Dict[Tuple[str, str], str] = {}
+    for state in dfa.states:
+        for symbol in dfa.alphabet:
+            next_state = dfa.get_next_state(state, symbol)
+            if next_state is not None:
+                delta[(state, symbol)] = next_state
+
+    # Remove unreachable states first
+    reachable = find_reachable_states(dfa, delta)
+
+    # Re-index reachable states and symbols as small integers. The
+    # refinement kernel below then hashes and compares ints only, never
+    # state-name strings, and the inverse map becomes plain list indexing.
+    states_list = list(reachable)
+    index_of = {state: i for i, state in enumerate(states_list)}
+    symbols = list(dfa.alphabet)
+    n_states = len(states_list)
+    n_symbols = len(symbols)
+
+    # inverse[sym][dst] = list of source indices with delta(src, sym) == dst
+    inverse: List[List[List[int]]] = [
+        [[] for _ in range(n_states)] for _ in range(n_symbols)
+    ]
+    for sym_idx, symbol in enumerate(symbols):
+        inv_row = inverse[sym_idx]
+        for state_idx, state in enumerate(states_list):
+            dst = delta.get((state, symbol))
+            if dst is not None and dst in index_of:
+                inv_row[index_of[dst]].append(state_idx)
+
+    # Initial split: accepting vs non-accepting; the kernel refines from there
+    accept = {index_of[s] for s in dfa.accept_states if s in index_of}
+    partitions = _hopcroft(inverse, accept, n_states, n_symbols)
+
+    # Map index partitions back to state names and build the minimized DFA
+    name_partitions = [{states_list[i] for i in p} for p in partitions]
+    return build_minimized_dfa(dfa, name_partitions, delta)
+
+
+def find_reachable_states(dfa: DFA, delta: Dict[Tuple[str, str], str]) -> Set[str]:
+    """Find all states reachable from the start state."""
+    reachable = set()
+    stack = [dfa.start_state]
+
+    while stack:
+        state = stack.pop()
+        if state in reachable:
+            continue
+
+        reachable.add(state)
+
+        for symbol in dfa.alphabet:
+            next_state = delta.get((state, symbol))
+            if next_state and next_state not in reachable:
+                stack.append(next_state)
+
+    return reachable
+
+
+def build_minimized_dfa(original_dfa: DFA, partitions: List[Set[str]],
+                        delta: Dict[Tuple[str, str], str]) -> DFA:
+    """Build a new DFA from partitions."""
+    minimized = DFA()
+    
+    # Create mapping from old states to partition representatives
+    state_map: Dict[str, str] = {}
+    partition_reps: Dict[int, str] = {}
+    
+    for i, partition in enumerate(partitions):
+        # Use first state as representative
+        rep = f"q{i}"
+        partition_reps[i] = rep
+        minimized.add_state(rep)
+        
+        for state in partition:
+            state_map[state] = rep
+            
+            # Check if this is an accept state
+            if state in original_dfa.accept_states:
+                minimized.accept_states.add(rep)
+    
+    # Set start state
+    minimized.start_state = state_map[original_dfa.start_state]
+    
+    # Add transitions (one per partition)
+    added_transitions = set()
+    for partition in partitions:
+        rep_state = state_map[next(iter(partition))]
+        
+        # Use any state from partition to determine transitions
+        sample_state = next(iter(partition))
+        
+        for symbol in original_dfa.alphabet:
+            next_state = delta.get((sample_state, symbol))
+            
+            if next_state:
+                next_rep = state_map[next_state]
+                trans_key = (rep_state, symbol)
+                
+                if trans_key not in added_transitions:
+                    minimized.add_transition(rep_state, next_rep, symbol)
+                    added_transitions.add(trans_key)
+    
     return minimized
\ No newline at end of file
@@ -1,118 +1,156 @@
 """Regular expression parser."""
 
+import functools
 from typing import List, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RegexNode:
-    """AST node for regular expressions."""
+    """AST node for regular expressions.
+
+    Frozen so cached ASTs returned by parse_regex can be shared safely;
+    Thompson construction only reads nodes.
+    """
     type: str  # 'CHAR', 'STAR', 'PLUS', 'CONCAT', 'OR', 'EPSILON'
     value: Optional[str] = None
     left: Optional['RegexNode'] = None
     right: Optional['RegexNode'] = None
 
 
+# Single-character tokens; everything else tokenizes as CHAR or EPSILON
+_TOKEN_KINDS = {
+    '(': 'LPAREN',
+    ')': 'RPAREN',
+    '|': 'OR',
+    '*': 'STAR',
+    '+': 'PLUS',
+    'ε': 'EPSILON',
+}
+
+
 class RegexParser:
     """Parse regular expressions into AST."""
-    
+
     def __init__(self, regex: str):
         self.regex = regex.replace(' ', '')  # Remove spaces
+        self.tokens = self._tokenize(self.regex)
         self.pos = 0
-    
+
+    @staticmethod
+    def _tokenize(regex: str) -> tuple:
+        """Tokenize in a single pass; parsing then walks a token tuple
+        by index instead of peeking at raw characters."""
+        tokens = []
+        append = tokens.append
+        i = 0
+        length = len(regex)
+
+        while i < length:
+            char = regex[i]
+            kind = _TOKEN_KINDS.get(char)
+
+            if kind is not None:
+                append((kind, None))
+            elif char == '\\' and i + 1 < length and regex[i + 1] == 'e':
+                append(('EPSILON', None))
+                i += 1  # skip the 'e'
+            else:
+                append(('CHAR', char))
+
+            i += 1
+
+        return tuple(tokens)
+
     def peek(self) -> Optional[str]:
-        """Peek at current character without consuming."""
-        if self.pos < len(self.regex):
-            return self.regex[self.pos]
-        return None
-    
-    def consume(self) -> Optional[str]:
-        """Consume and return current character."""
-        if self.pos < len(self.regex):
-            char = self.regex[self.pos]
-            self.pos += 1
-            return char
+        """Peek at the current token kind without consuming."""
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos][0]
         return None
-    
+
     def parse(self) -> RegexNode:
         """Parse the entire regex."""
         return self.parse_or()
-    
+
     def parse_or(self) -> RegexNode:
         """Parse OR expressions (lowest precedence)."""
         left = self.parse_concat()
-        
-        while self.peek() == '|':
-            self.consume()  # consume '|'
+
+        while self.peek() == 'OR':
+            self.pos += 1  # consume '|'
             right = self.parse_concat()
             left = RegexNode(type='OR', left=left, right=right)
-        
+
         return left
-    
+
     def parse_concat(self) -> RegexNode:
         """Parse concatenation (implicit operator)."""
         nodes = []
-        
-        while self.peek() and self.peek() not in ')|':
+
+        while self.peek() not in (None, 'RPAREN', 'OR'):
             nodes.append(self.parse_star())
-        
+
         if not nodes:
             return RegexNode(type='EPSILON')
-        
+
         # Build left-associative concat tree
         result = nodes[0]
         for node in nodes[1:]:
             result = RegexNode(type='CONCAT', left=result, right=node)
-        
+
         return result
-    
+
     def parse_star(self) -> RegexNode:
         """Parse star and plus operators (highest precedence)."""
         node = self.parse_base()
-        
-        char = self.peek()
-        while char and char in '*+':
-            op = self.consume()
-            if op == '*':
-                node = RegexNode(type='STAR', left=node)
-            else:  # '+'
-                node = RegexNode(type='PLUS', left=node)
-            char = self.peek()
-        
+
+        # Run-length consume: bind the token tuple and position locally
+        # so chained postfix operators cost no method calls per operator
+        tokens = self.tokens
+        n_tokens = len(tokens)
+        pos = self.pos
+
+        while pos < n_tokens and (kind := tokens[pos][0]) in ('STAR', 'PLUS'):
+            pos += 1
+            node = RegexNode(type=kind, left=node)
+
+        self.pos = pos
         return node
-    
+
     def parse_base(self) -> RegexNode:
         """Parse base expressions (characters, epsilon, parentheses)."""
-        char = self.peek()
-        
-        if char == '(':
-            self.consume()  # consume '('
+        kind = self.peek()
+
+        if kind == 'LPAREN':
+            self.pos += 1  # consume '('
             node = self.parse_or()
-            if self.peek() == ')':
-                self.consume()  # consume ')'
+            if self.peek() == 'RPAREN':
+                self.pos += 1  # consume ')'
             else:
-                raise ValueError(f"Expected ')' at position {self.pos}")
+                raise ValueError(f"Expected ')' at token {self.pos}")
             return node
-        
-        elif char == 'ε' or (char == '\\' and self.pos + 1 < len(self.regex) and self.regex[self.pos + 1] == 'e'):
-            if char == '\\':
-                self.consume()  # consume '\'
-                self.consume()  # consume 'e'
-            else:
-                self.consume()  # consume 'ε'
+
+        elif kind == 'EPSILON':
+            self.pos += 1
             return RegexNode(type='EPSILON')
-        
-        elif char and char not in ')|*+':
-            self.consume()
-            return RegexNode(type='CHAR', value=char)
-        
+
+        elif kind == 'CHAR':
+            value = self.tokens[self.pos][1]
+            self.pos += 1
+            return RegexNode(type='CHAR', value=value)
+
         else:
-            raise ValueError(f"Unexpected character '{char}' at position {self.pos}")
+            raise ValueError(f"Unexpected token '{kind}' at position {self.pos}")
 
 
+@functools.lru_cache(maxsize=128)
 def parse_regex(regex: str) -> RegexNode:
     """
     Parse a regular expression string into an AST.
+
+    Results are memoized: the parser is pure and the GUI re-parses the
+    same short strings repeatedly, so identical input returns the cached
+    (immutable) AST.
     
     Supported operators:
     - * (Kleene star)
@@ -1,35 +1,179 @@
 """Subset construction algorithm for converting NFA to DFA."""
 
-from typing import Set, Dict, Tuple, FrozenSet
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, Set, Tuple
+from weakref import WeakKeyDictionary
+
 from models.nfa import NFA, EpsilonNFA
 from models.dfa import DFA
 
+# Per-NFA cache of single-state closures, the common case when
+# epsilon_nfa_to_nfa walks every state. Keyed weakly so discarded
+# automata don't pin their closure tables. Entries assume the NFA is
+# fully built before conversion starts (which the pipeline guarantees).
+_singleton_closures: "WeakKeyDictionary[EpsilonNFA, Dict[str, FrozenSet[str]]]" = WeakKeyDictionary()
+
+# Per-NFA bitset tables: states indexed as bits of a Python int, with
+# the full ε-closure mask of every state precomputed. Built lazily,
+# same staleness caveat as above.
+_eps_tables: "WeakKeyDictionary[EpsilonNFA, tuple]" = WeakKeyDictionary()
+
+
+def _eps_table(nfa: EpsilonNFA) -> tuple:
+    """Return (index_of, states_list, closure_masks) for the NFA.
+
+    All closures are computed in one pass: iterative Tarjan over the
+    ε-only subgraph collapses each SCC (the cycles STAR/PLUS introduce),
+    and each SCC's closure is its member mask ORed with the closures of
+    its successor SCCs. Tarjan finalizes an SCC only after everything
+    reachable from it, so successor closures are always complete when
+    read. A closure query is then a single table lookup.
+    """
+    table = _eps_tables.get(nfa)
+    if table is not None:
+        return table
+
+    states_list, index_of, _, sym_id, offsets, syms, dsts = nfa.finalize()
+    n = len(states_list)
+    eps_id = sym_id.get('ε')
+    adj = [[] for _ in range(n)]
+    if eps_id is not None:
+        for state in range(n):
+            adj_row = adj[state]
+            for k in range(offsets[state], offsets[state + 1]):
+                if syms[k] == eps_id:
+                    adj_row.append(dsts[k])
+
+    indices = [-1] * n
+    lowlink = [0] * n
+    on_stack = [False] * n
+    scc_stack = []
+    closure_masks = [0] * n
+    counter = 0
+
+    for root in range(n):
+        if indices[root] != -1:
+            continue
+
+        # Explicit DFS stack of (state, next-edge index) pairs; no
+        # recursion so deep ε-chains can't blow the recursion limit.
+        work = [(root, 0)]
+        while work:
+            v, edge_i = work[-1]
+            if edge_i == 0:
+                indices[v] = lowlink[v] = counter
+                counter += 1
+                scc_stack.append(v)
+                on_stack[v] = True
+
+            descended = False
+            adj_v = adj[v]
+            for i in range(edge_i, len(adj_v)):
+                w = adj_v[i]
+                if indices[w] == -1:
+                    work[-1] = (v, i + 1)
+                    work.append((w, 0))
+                    descended = True
+                    break
+                if on_stack[w] and indices[w] < lowlink[v]:
+                    lowlink[v] = indices[w]
+            if descended:
+                continue
+
+            if lowlink[v] == indices[v]:
+                # v is an SCC root: pop its members and finalize their
+                # shared closure mask
+                member_mask = 0
+                members = []
+                while True:
+                    w = scc_stack.pop()
+                    on_stack[w] = False
+                    members.append(w)
+                    member_mask |= 1 << w
+                    if w == v:
+                        break
+
+                full = member_mask
+                for w in members:
+                    for x in adj[w]:
+                        if not (member_mask >> x) & 1:
+                            full |= closure_masks[x]
+                for w in members:
+                    closure_masks[w] = full
+
+            work.pop()
+            if work:
+                u = work[-1][0]
+                if lowlink[v] < lowlink[u]:
+                    lowlink[u] = lowlink[v]
+
+    table = (index_of, states_list, closure_masks)
+    _eps_tables[nfa] = table
+    return table
+
 
 def epsilon_closure(nfa: EpsilonNFA, states: Set[str]) -> Set[str]:
     """
     Compute the epsilon closure of a set of states.
-    
+
     Args:
         nfa: The epsilon-NFA
         states: Set of states
-        
+
     Returns:
         Set of states reachable via epsilon transitions
     """
-    closure = set(states)
-    stack = list(states)
-    
-    while stack:
-        state = stack.pop()
-        # Get epsilon transitions from this state
-        for next_state in nfa.get_transitions(state, 'ε'):
-            if next_state not in closure:
-                closure.add(next_state)
-                stack.append(next_state)
-    
+    if len(states) == 1:
+        return set(_closure_of_state(nfa, next(iter(states))))
+    return _compute_closure(nfa, states)
+
+
+def _closure_of_state(nfa: EpsilonNFA, state: str) -> FrozenSet[str]:
+    """Epsilon closure of a single state, cached per NFA instance."""
+    per_nfa = _singleton_closures.setdefault(nfa, {})
+    closure = per_nfa.get(state)
+    if closure is None:
+        closure = frozenset(_compute_closure(nfa, (state,)))
+        per_nfa[state] = closure
+    return closure
+
+
+def _compute_closure(nfa: EpsilonNFA, states: Iterable[str]) -> Set[str]:
+    """Union of precomputed closure masks, decoded back to state names.
+
+    The SCC table answers each state's closure in O(1); no per-query
+    graph traversal remains.
+    """
+    index_of, states_list, closure_masks = _eps_table(nfa)
+
+    closure_mask = 0
+    for state in states:
+        closure_mask |= closure_masks[index_of[state]]
+
+    closure = set()
+    bits = closure_mask
+    while bits:
+        low = bits & -bits
+        closure.add(states_list[low.bit_length() - 1])
+        bits ^= low
+
     return closure
 
 
+def precompute_epsilon_closures(nfa: EpsilonNFA) -> None:
+    """Warm the per-state closure cache for a fully built ε-NFA.
+
+    Thompson's construction calls this once after the final fragment is
+    committed, so conversions that follow find every singleton closure
+    already materialized instead of running the bitset fixed point per
+    state on first touch.
+    """
+    per_nfa = _singleton_closures.setdefault(nfa, {})
+    for state in nfa.states:
+        if state not in per_nfa:
+            per_nfa[state] = frozenset(_compute_closure(nfa, (state,)))
+
+
 def epsilon_nfa_to_nfa(enfa: EpsilonNFA) -> NFA:
     """
     Convert an epsilon-NFA to an NFA (removing epsilon transitions).
@@ -53,19 +197,20 @@ def epsilon_nfa_to_nfa(enfa: EpsilonNFA) -> NFA:
     for state in enfa.states:
         e_closure = epsilon_closure(enfa, {state})
         
-        # Check if any state in epsilon closure is accepting
-        if any(s in enfa.accept_states for s in e_closure):
+        # Check if any state in epsilon closure is accepting: one
+        # C-level intersection instead of a per-state membership loop
+        if e_closure & enfa.accept_states:
             nfa.accept_states.add(state)
-        
+
         # Add transitions for each symbol in alphabet (excluding epsilon)
         for symbol in enfa.alphabet:
             if symbol == 'ε':
                 continue
-                
+
             # Get all states reachable by this symbol from epsilon closure
             next_states = set()
             for s in e_closure:
-                next_states.update(enfa.get_transitions(s, symbol))
+                next_states.update(enfa.get_next_states(s, symbol))
             
             # Compute epsilon closure of the result
             if next_states:
@@ -76,71 +221,100 @@ def epsilon_nfa_to_nfa(enfa: EpsilonNFA) -> NFA:
     return nfa
 
 
+def _subset_construct(targets: list, start: int, accept_mask: int,
+                      n_symbols: int) -> tuple:
+    """Core subset-construction loop over packed bitset subsets.
+
+    A subset of NFA states is a single Python int with bit i set for
+    state i, and `targets[state][sym]` is the successor mask for one
+    state. Union is then a bignum OR, the accept test one AND, and the
+    dedup dict hashes a machine word per 64 states instead of a
+    frozenset of boxed ints.
+
+    Returns (subsets, subset_accepts, edges) where subsets is the list
+    of discovered subset masks in creation order (index = DFA state
+    id), subset_accepts is a parallel list of bools, and edges is a
+    list of (src_id, sym, dst_id) triples.
+    """
+    start_mask = 1 << start
+    subsets = [start_mask]
+    subset_accepts = [bool(start_mask & accept_mask)]
+    subset_ids: Dict[int, int] = {start_mask: 0}
+    edges = []
+
+    # Each subset is enqueued exactly once, when first created; the
+    # subset_ids dict doubles as the visited check.
+    queue = deque([(start_mask, 0)])
+
+    while queue:
+        current_mask, current_id = queue.popleft()
+
+        for sym in range(n_symbols):
+            # OR together the successor masks of every member state
+            next_mask = 0
+            bits = current_mask
+            while bits:
+                low = bits & -bits
+                next_mask |= targets[low.bit_length() - 1][sym]
+                bits ^= low
+
+            if next_mask:
+                next_id = subset_ids.get(next_mask)
+                if next_id is None:
+                    next_id = len(subsets)
+                    subset_ids[next_mask] = next_id
+                    subsets.append(next_mask)
+                    subset_accepts.append(bool(next_mask & accept_mask))
+                    queue.append((next_mask, next_id))
+
+                edges.append((current_id, sym, next_id))
+
+    return subsets, subset_accepts, edges
+
+
 def nfa_to_dfa(nfa: NFA) -> DFA:
     """
     Convert an NFA to a DFA using subset construction.
-    
+
     Args:
         nfa: The NFA to convert
-        
+
     Returns:
         Equivalent DFA
     """
+    # Read the CSR view: states and symbols are already dense integers,
+    # and each state's transitions sit in one contiguous slice instead
+    # of |Σ| hash-table probes per state.
+    states_list, index_of, symbols, _, offsets, syms, dsts = nfa.finalize()
+    n_states = len(states_list)
+    n_symbols = len(nfa.alphabet)
+
+    targets = [[0] * n_symbols for _ in range(n_states)]
+    for state in range(n_states):
+        row = targets[state]
+        for k in range(offsets[state], offsets[state + 1]):
+            sid = syms[k]
+            if sid < n_symbols:  # ε ids sit past the alphabet; skip them
+                row[sid] |= 1 << dsts[k]
+
+    accept_mask = sum(1 << index_of[s] for s in nfa.accept_states)
+
+    subsets, subset_accepts, edges = _subset_construct(
+        targets, index_of[nfa.start_state], accept_mask, n_symbols
+    )
+
+    # Decode kernel output back into a DFA; subset id i becomes q{i+1}
     dfa = DFA()
-    
-    # Start with the NFA's start state as a singleton set
-    start_state_set = frozenset({nfa.start_state})
-    state_map: Dict[FrozenSet[str], str] = {}
-    state_counter = [0]
-    
-    def get_dfa_state(nfa_states: FrozenSet[str]) -> str:
-        """Get or create DFA state for a set of NFA states."""
-        if nfa_states not in state_map:
-            state_counter[0] += 1
-            dfa_state = f"q{state_counter[0]}"
-            state_map[nfa_states] = dfa_state
-            
-            # Add state to DFA
-            dfa.add_state(dfa_state)
-            
-            # Check if this is an accept state
-            if any(s in nfa.accept_states for s in nfa_states):
-                dfa.accept_states.add(dfa_state)
-        
-        return state_map[nfa_states]
-    
-    # Create start state
-    dfa.start_state = get_dfa_state(start_state_set)
-    
-    # Queue of state sets to process
-    queue = [start_state_set]
-    processed = set()
-    
-    while queue:
-        current_set = queue.pop(0)
-        
-        if current_set in processed:
-            continue
-        processed.add(current_set)
-        
-        current_dfa_state = get_dfa_state(current_set)
-        
-        # For each symbol in alphabet
-        for symbol in nfa.alphabet:
-            # Compute the set of states reachable by this symbol
-            next_states = set()
-            for nfa_state in current_set:
-                next_states.update(nfa.get_transitions(nfa_state, symbol))
-            
-            if next_states:
-                next_state_set = frozenset(next_states)
-                next_dfa_state = get_dfa_state(next_state_set)
-                
-                # Add transition to DFA
-                dfa.add_transition(current_dfa_state, next_dfa_state, symbol)
-                
-                # Add to queue if not processed
-                if next_state_set not in processed:
-                    queue.append(next_state_set)
-    
+    names = [f"q{i + 1}" for i in range(len(subsets))]
+
+    for name, is_accept in zip(names, subset_accepts):
+        dfa.add_state(name)
+        if is_accept:
+            dfa.accept_states.add(name)
+
+    dfa.start_state = names[0]
+
+    for src_id, sym, dst_id in edges:
+        dfa.add_transition(names[src_id], names[dst_id], symbols[sym])
+
     return dfa
\ No newline at end of file
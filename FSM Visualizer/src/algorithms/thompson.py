@@ -1,151 +1,180 @@
-"""Thompson's construction algorithm for converting regex to ε-NFA."""
-
-from models.nfa import EpsilonNFA
-from typing import List, Union  
-from .regex_parser import RegexNode, parse_regex
-
-
-class ThompsonFragment:
-    """Fragment of an NFA during Thompson's construction."""
-    
-    def __init__(self, start: str, accept: str):
-        self.start = start
-        self.accept = accept
-
-
-def thompson_construction(regex: str) -> EpsilonNFA:
-    """
-    Convert a regular expression to an ε-NFA using Thompson's construction.
-    
-    Args:
-        regex: Regular expression string
-    
-    Returns:
-        EpsilonNFA representing the regex
-    """
-    ast = parse_regex(regex)
-    nfa = EpsilonNFA()
-    state_counter = [0]  # Use list to allow mutation in nested function
-    
-    def new_state() -> str:
-        """Generate a new unique state name."""
-        state_counter[0] += 1
-        return f"q{state_counter[0]}"
-    
-    def build_fragment(node: RegexNode) -> ThompsonFragment:
-        """Recursively build NFA fragment from AST node."""
-        
-        if node.type == 'EPSILON':
-            # ε transition from start to accept
-            start = new_state()
-            accept = new_state()
-            nfa.add_state(start)
-            nfa.add_state(accept, is_accept=True)
-            nfa.add_transition(start, accept, 'ε')
-            return ThompsonFragment(start, accept)
-        
-        elif node.type == 'CHAR':
-            # Single character transition
-            start = new_state()
-            accept = new_state()
-            nfa.add_state(start)
-            nfa.add_state(accept, is_accept=True)
-            nfa.add_transition(start, accept, node.value)
-            return ThompsonFragment(start, accept)
-        
-        elif node.type == 'CONCAT':
-            # Concatenation: connect two fragments
-            left_frag = build_fragment(node.left)
-            right_frag = build_fragment(node.right)
-            
-            # Remove accept status from left fragment's accept state
-            nfa.states[left_frag.accept].is_accept = False
-            nfa.accept_states.discard(left_frag.accept)
-            
-            # Connect left accept to right start with ε
-            nfa.add_transition(left_frag.accept, right_frag.start, 'ε')
-            
-            return ThompsonFragment(left_frag.start, right_frag.accept)
-        
-        elif node.type == 'OR':
-            # Alternation: create new start and accept states
-            left_frag = build_fragment(node.left)
-            right_frag = build_fragment(node.right)
-            
-            start = new_state()
-            accept = new_state()
-            nfa.add_state(start)
-            nfa.add_state(accept, is_accept=True)
-            
-            # Remove accept status from fragment accept states
-            nfa.states[left_frag.accept].is_accept = False
-            nfa.states[right_frag.accept].is_accept = False
-            nfa.accept_states.discard(left_frag.accept)
-            nfa.accept_states.discard(right_frag.accept)
-            
-            # Connect new start to both fragments
-            nfa.add_transition(start, left_frag.start, 'ε')
-            nfa.add_transition(start, right_frag.start, 'ε')
-            
-            # Connect both fragments to new accept
-            nfa.add_transition(left_frag.accept, accept, 'ε')
-            nfa.add_transition(right_frag.accept, accept, 'ε')
-            
-            return ThompsonFragment(start, accept)
-        
-        elif node.type == 'STAR':
-            # Kleene star: loop back and allow skip
-            inner_frag = build_fragment(node.left)
-            
-            start = new_state()
-            accept = new_state()
-            nfa.add_state(start)
-            nfa.add_state(accept, is_accept=True)
-            
-            # Remove accept status from inner fragment
-            nfa.states[inner_frag.accept].is_accept = False
-            nfa.accept_states.discard(inner_frag.accept)
-            
-            # Connect: start -> inner_start, start -> accept (skip)
-            nfa.add_transition(start, inner_frag.start, 'ε')
-            nfa.add_transition(start, accept, 'ε')
-            
-            # Connect: inner_accept -> inner_start (loop), inner_accept -> accept
-            nfa.add_transition(inner_frag.accept, inner_frag.start, 'ε')
-            nfa.add_transition(inner_frag.accept, accept, 'ε')
-            
-            return ThompsonFragment(start, accept)
-        
-        elif node.type == 'PLUS':
-            # One or more: A+ = AA*
-            inner_frag = build_fragment(node.left)
-            
-            start = new_state()
-            accept = new_state()
-            nfa.add_state(start)
-            nfa.add_state(accept, is_accept=True)
-            
-            # Remove accept status from inner fragment
-            nfa.states[inner_frag.accept].is_accept = False
-            nfa.accept_states.discard(inner_frag.accept)
-            
-            # Connect: start -> inner_start (must go through once)
-            nfa.add_transition(start, inner_frag.start, 'ε')
-            
-            # Connect: inner_accept -> inner_start (loop), inner_accept -> accept
-            nfa.add_transition(inner_frag.accept, inner_frag.start, 'ε')
-            nfa.add_transition(inner_frag.accept, accept, 'ε')
-            
-            return ThompsonFragment(start, accept)
-        
-        else:
-            raise ValueError(f"Unknown node type: {node.type}")
-    
-    # Build the complete NFA
-    fragment = build_fragment(ast)
-    
-    # Set start state
-    nfa.start_state = fragment.start
-    nfa.states[fragment.start].is_start = True
-    
-    return nfa
+"""Thompson's construction algorithm for converting regex to ε-NFA."""
+
+import sys
+
+from models.nfa import EpsilonNFA
+from typing import List, NamedTuple, Union
+from .regex_parser import RegexNode, parse_regex
+from .subset_construction import precompute_epsilon_closures
+
+# Interned once so every ε-edge shares one symbol object and downstream
+# transition-table lookups compare by pointer.
+EPSILON = sys.intern('ε')
+
+
+class ThompsonFragment(NamedTuple):
+    """Fragment of an NFA during Thompson's construction.
+
+    A NamedTuple: fragments are allocated per AST node and immediately
+    discarded, so skipping the per-instance __dict__ keeps them cheap.
+    """
+    start: str
+    accept: str
+
+
+def thompson_construction(regex: str) -> EpsilonNFA:
+    """
+    Convert a regular expression to an ε-NFA using Thompson's construction.
+    
+    Args:
+        regex: Regular expression string
+    
+    Returns:
+        EpsilonNFA representing the regex
+    """
+    ast = parse_regex(regex)
+    nfa = EpsilonNFA()
+    state_counter = [0]  # Use list to allow mutation in nested function
+    
+    def new_state() -> str:
+        """Generate a new unique state name."""
+        state_counter[0] += 1
+        return f"q{state_counter[0]}"
+    
+    def build_fragment(root: RegexNode) -> ThompsonFragment:
+        """Build the NFA fragment for an AST iteratively.
+
+        Explicit post-order stack instead of recursion: deep regexes
+        (long concatenations, nested groups) no longer risk hitting the
+        recursion limit, and each node costs a tuple push/pop rather
+        than a Python call frame. Child fragments are parked in a dict
+        keyed by node id until their parent is emitted.
+        """
+        fragments: dict = {}
+        stack = [(root, False)]
+
+        while stack:
+            node, children_done = stack.pop()
+            node_type = node.type
+
+            if not children_done:
+                if node_type in ('CONCAT', 'OR'):
+                    stack.append((node, True))
+                    stack.append((node.right, False))
+                    stack.append((node.left, False))
+                    continue
+                if node_type in ('STAR', 'PLUS'):
+                    stack.append((node, True))
+                    stack.append((node.left, False))
+                    continue
+                # Leaves fall through and are emitted on first visit
+
+            if node_type == 'EPSILON':
+                # ε transition from start to accept
+                start = new_state()
+                accept = new_state()
+                nfa.add_state(start)
+                nfa.add_state(accept)
+                nfa.add_transition(start, accept, EPSILON)
+                fragments[id(node)] = ThompsonFragment(start, accept)
+
+            elif node_type == 'CHAR':
+                # Single character transition
+                start = new_state()
+                accept = new_state()
+                nfa.add_state(start)
+                nfa.add_state(accept)
+                nfa.add_transition(start, accept, node.value)
+                fragments[id(node)] = ThompsonFragment(start, accept)
+
+            elif node_type == 'CONCAT':
+                # Concatenation: connect two fragments
+                left_frag = fragments.pop(id(node.left))
+                right_frag = fragments.pop(id(node.right))
+
+                # Connect left accept to right start with ε
+                nfa.add_transition(left_frag.accept, right_frag.start, EPSILON)
+
+                fragments[id(node)] = ThompsonFragment(left_frag.start, right_frag.accept)
+
+            elif node_type == 'OR':
+                # Alternation: create new start and accept states
+                left_frag = fragments.pop(id(node.left))
+                right_frag = fragments.pop(id(node.right))
+
+                start = new_state()
+                accept = new_state()
+                nfa.add_state(start)
+                nfa.add_state(accept)
+
+                # Connect new start to both fragments
+                nfa.add_transition(start, left_frag.start, EPSILON)
+                nfa.add_transition(start, right_frag.start, EPSILON)
+
+                # Connect both fragments to new accept
+                nfa.add_transition(left_frag.accept, accept, EPSILON)
+                nfa.add_transition(right_frag.accept, accept, EPSILON)
+
+                fragments[id(node)] = ThompsonFragment(start, accept)
+
+            elif node_type == 'STAR':
+                # Kleene star: loop back and allow skip
+                inner_frag = fragments.pop(id(node.left))
+
+                start = new_state()
+                accept = new_state()
+                nfa.add_state(start)
+                nfa.add_state(accept)
+
+                # Connect: start -> inner_start, start -> accept (skip)
+                nfa.add_transition(start, inner_frag.start, EPSILON)
+                nfa.add_transition(start, accept, EPSILON)
+
+                # Connect: inner_accept -> inner_start (loop), inner_accept -> accept
+                nfa.add_transition(inner_frag.accept, inner_frag.start, EPSILON)
+                nfa.add_transition(inner_frag.accept, accept, EPSILON)
+
+                fragments[id(node)] = ThompsonFragment(start, accept)
+
+            elif node_type == 'PLUS':
+                # One or more: A+ = AA*
+                inner_frag = fragments.pop(id(node.left))
+
+                start = new_state()
+                accept = new_state()
+                nfa.add_state(start)
+                nfa.add_state(accept)
+
+                # Connect: start -> inner_start (must go through once)
+                nfa.add_transition(start, inner_frag.start, EPSILON)
+
+                # Connect: inner_accept -> inner_start (loop), inner_accept -> accept
+                nfa.add_transition(inner_frag.accept, inner_frag.start, EPSILON)
+                nfa.add_transition(inner_frag.accept, accept, EPSILON)
+
+                fragments[id(node)] = ThompsonFragment(start, accept)
+
+            else:
+                raise ValueError(f"Unknown node type: {node_type}")
+
+        return fragments[id(root)]
+    
+    # Build the complete NFA. Fragments never mark intermediate accept
+    # states, so only the final fragment's accept state is committed here
+    # instead of being set and unset once per operator.
+    fragment = build_fragment(ast)
+    
+    # Set start and accept states
+    nfa.start_state = fragment.start
+    nfa.states[fragment.start].is_start = True
+    nfa.states[fragment.accept].is_accept = True
+    nfa.accept_states.add(fragment.accept)
+
+    # The structure is final at this point: freeze the CSR transition
+    # view and materialize every per-state closure now, so
+    # epsilon_nfa_to_nfa reads cached frozensets and contiguous slices
+    # instead of chasing ε-edges per subset.
+    nfa.finalize()
+    precompute_epsilon_closures(nfa)
+
+    return nfa
@@ -1,10 +1,10 @@
 """Main window for the FSM Visualizer application."""
 
-from ..qt_compat import QtWidgets, QtCore, QtGui
-import tempfile
-import os
+from ..qt_compat import QtWidgets, QtCore, QtGui, Signal
 import subprocess
 
+from .._deps import check_all
+
 from ..parsers.json_parser import parse_json_automaton
 from ..parsers.text_parser import parse_text_automaton
 from ..algorithms.thompson import thompson_construction
@@ -20,12 +20,67 @@ from .simulation_widget import SimulationWidget
 from .export_dialog import ExportDialog
 
 
+class _ParseSignals(QtCore.QObject):
+    """Signal holder for _ParseTask; a bare QRunnable cannot emit."""
+    finished = Signal(object, str)
+
+
+class _ParseTask(QtCore.QRunnable):
+    """Off-thread parse of one input snapshot.
+
+    Only the pure parsing and validation work runs here; the finished
+    signal hands the automaton (or an error message) back to the UI
+    thread, which still owns all rendering.
+    """
+
+    def __init__(self, kind: str, text: str):
+        super().__init__()
+        self.kind = kind
+        self.text = text
+        self.signals = _ParseSignals()
+
+    def run(self):
+        try:
+            if self.kind == 'json':
+                automaton = parse_json_automaton(self.text)
+            elif self.kind == 'text':
+                automaton = parse_text_automaton(self.text)
+            else:  # regex
+                automaton = thompson_construction(self.text)
+
+            is_valid, msg = automaton.validate()
+            if not is_valid:
+                raise ValueError(f"Invalid automaton: {msg}")
+        except Exception as e:
+            self.signals.finished.emit(None, str(e))
+        else:
+            self.signals.finished.emit(automaton, "")
+
+
 class MainWindow(QtWidgets.QMainWindow):
     """Main application window."""
     
     def __init__(self):
         super().__init__()
         self.current_automaton = None
+        # Rendered pixmaps keyed by DOT source. Conversion actions often
+        # revisit the same automaton (convert, minimize, convert back),
+        # and a cache hit skips the dot subprocess entirely.
+        self._render_cache = {}
+        # Currently displayed (DOT source, unscaled pixmap) pair and the
+        # last smooth-scaled result keyed by (source, label size), so
+        # repeated refreshes at the same size skip the bilinear resample.
+        self._displayed = None
+        self._scaled_cache = None
+        # Probe for the dot binary once at startup; the old code
+        # spawned `dot -V` on every single visualize call.
+        self._graphviz_ok = check_all().dot_version is not None
+        # Debounce for window resizes: fast rescales while dragging,
+        # one smooth pass after the size settles.
+        self._rescale_timer = QtCore.QTimer(self)
+        self._rescale_timer.setSingleShot(True)
+        self._rescale_timer.setInterval(150)
+        self._rescale_timer.timeout.connect(lambda: self._apply_scaled(smooth=True))
         self.init_ui()
     
     def init_ui(self):
@@ -117,7 +172,13 @@ class MainWindow(QtWidgets.QMainWindow):
         minimize_action = QAction("Minimize DFA", self)
         minimize_action.triggered.connect(self.minimize_dfa_action)
         convert_menu.addAction(minimize_action)
-        
+
+        convert_menu.addSeparator()
+
+        pipeline_action = QAction("Regex to Minimized DFA", self)
+        pipeline_action.triggered.connect(self.convert_pipeline_regex_to_min_dfa)
+        convert_menu.addAction(pipeline_action)
+
         convert_menu.addSeparator()
         
         mealy_moore_action = QAction("Mealy to Moore", self)
@@ -169,10 +230,10 @@ class MainWindow(QtWidgets.QMainWindow):
         
         layout.addWidget(self.input_tabs)
         
-        # Parse button
-        parse_btn = QtWidgets.QPushButton("Parse & Visualize")
-        parse_btn.clicked.connect(self.parse_and_visualize)
-        layout.addWidget(parse_btn)
+        # Parse button (kept on self so the worker slot can re-enable it)
+        self.parse_btn = QtWidgets.QPushButton("Parse & Visualize")
+        self.parse_btn.clicked.connect(self.parse_and_visualize)
+        layout.addWidget(self.parse_btn)
         
         # Simulation section
         layout.addWidget(QtWidgets.QLabel("Simulation:"))
@@ -204,40 +265,54 @@ class MainWindow(QtWidgets.QMainWindow):
         return panel
     
     def parse_and_visualize(self):
-        """Parse input and visualize the automaton."""
+        """Parse input on a worker thread, then visualize.
+
+        Snapshotting the text and parsing via QThreadPool keeps the UI
+        responsive on large inputs (huge regexes used to freeze the
+        window for the whole construction).
+        """
         current_tab = self.input_tabs.currentIndex()
-        
+
         try:
             if current_tab == 0:  # JSON
-                json_text = self.json_input.toPlainText().strip()
-                if not json_text:
+                kind, text = 'json', self.json_input.toPlainText().strip()
+                if not text:
                     raise ValueError("JSON input is empty")
-                self.current_automaton = parse_json_automaton(json_text)
-            
+
             elif current_tab == 1:  # Text
-                text = self.text_input.toPlainText().strip()
+                kind, text = 'text', self.text_input.toPlainText().strip()
                 if not text:
                     raise ValueError("Text input is empty")
-                self.current_automaton = parse_text_automaton(text)
-            
-            elif current_tab == 2:  # Regex
-                regex = self.regex_input.toPlainText().strip()
-                if not regex:
+
+            else:  # Regex
+                kind, text = 'regex', self.regex_input.toPlainText().strip()
+                if not text:
                     raise ValueError("Regex input is empty")
-                self.current_automaton = thompson_construction(regex)
-            
-            # Validate
-            is_valid, msg = self.current_automaton.validate()
-            if not is_valid:
-                raise ValueError(f"Invalid automaton: {msg}")
-            
-            # Visualize
-            self.visualize_current_automaton()
-            self.statusBar().showMessage("Automaton loaded successfully")
-        
-        except Exception as e:
+
+        except ValueError as e:
             QtWidgets.QMessageBox.critical(self, "Error", f"Failed to parse automaton:\n{str(e)}")
             self.statusBar().showMessage("Error parsing automaton")
+            return
+
+        self.parse_btn.setEnabled(False)
+        self.statusBar().showMessage("Parsing...")
+
+        task = _ParseTask(kind, text)
+        task.signals.finished.connect(self._on_parse_finished)
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _on_parse_finished(self, automaton, error: str):
+        """UI-thread slot: display the worker's parse result."""
+        self.parse_btn.setEnabled(True)
+
+        if automaton is None:
+            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to parse automaton:\n{error}")
+            self.statusBar().showMessage("Error parsing automaton")
+            return
+
+        self.current_automaton = automaton
+        self.visualize_current_automaton()
+        self.statusBar().showMessage("Automaton loaded successfully")
     
     def visualize_current_automaton(self):
         """Visualize the current automaton."""
@@ -245,10 +320,8 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         
         try:
-            # Check if Graphviz is available
-            try:
-                subprocess.run(['dot', '-V'], capture_output=True, timeout=5, check=True)
-            except (FileNotFoundError, subprocess.SubprocessError):
+            # Check if Graphviz is available (probed once in __init__)
+            if not self._graphviz_ok:
                 error_msg = (
                     "Graphviz is not installed or not in your system PATH.\n\n"
                     "Please install Graphviz:\n"
@@ -261,28 +334,31 @@ class MainWindow(QtWidgets.QMainWindow):
                 QtWidgets.QMessageBox.critical(self, "Graphviz Not Found", error_msg)
                 return
             
-            # Render graph
+            # Render graph, reusing the cached pixmap when the DOT
+            # source is identical to a previous render
             dot = render_automaton(self.current_automaton)
-            
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp:
-                tmp_path = tmp.name
-            
-            dot.render(tmp_path.replace('.png', ''), format='png', cleanup=True)
-            
+            pixmap = self._render_cache.get(dot.source)
+
+            if pixmap is None:
+                # Pipe the DOT source straight through dot and load the
+                # PNG bytes from memory — no temporary file on disk
+                png_bytes = subprocess.run(
+                    ['dot', '-Tpng'],
+                    input=dot.source.encode('utf-8'),
+                    capture_output=True, check=True
+                ).stdout
+
+                pixmap = QtGui.QPixmap()
+                pixmap.loadFromData(png_bytes, 'PNG')
+                self._render_cache[dot.source] = pixmap
+
             # Display image
-            pixmap = QtGui.QPixmap(tmp_path)
-            scaled_pixmap = pixmap.scaled(self.graph_label.size(), 
-                                         QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                                         QtCore.Qt.TransformationMode.SmoothTransformation)
-            self.graph_label.setPixmap(scaled_pixmap)
-            
-            # Clean up
-            try:
-                os.unlink(tmp_path)
-            except:
-                pass
-            
+            self._displayed = (dot.source, pixmap)
+            self._apply_scaled(smooth=True)
+
+            # Rebind the simulation formatter for the new automaton
+            self.simulation_widget.bind_automaton(self.current_automaton)
+
             # Update info
             self.update_info_display()
         
@@ -295,18 +371,59 @@ class MainWindow(QtWidgets.QMainWindow):
                 )
             QtWidgets.QMessageBox.critical(self, "Visualization Error", error_msg)
     
+    def _apply_scaled(self, smooth: bool = True):
+        """Scale the displayed pixmap to the label size.
+
+        The smooth bilinear resample is the expensive part of a refresh;
+        identical (source, size) pairs reuse the cached result, and
+        resize drags take the fast scaler until the debounce timer runs
+        the final smooth pass.
+        """
+        if self._displayed is None:
+            return
+
+        source, pixmap = self._displayed
+        size = self.graph_label.size()
+
+        if smooth:
+            cached = self._scaled_cache
+            if cached is not None and cached[0] == source and cached[1] == size:
+                self.graph_label.setPixmap(cached[2])
+                return
+            mode = QtCore.Qt.TransformationMode.SmoothTransformation
+        else:
+            mode = QtCore.Qt.TransformationMode.FastTransformation
+
+        scaled = pixmap.scaled(size,
+                               QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                               mode)
+        if smooth:
+            self._scaled_cache = (source, size, scaled)
+        self.graph_label.setPixmap(scaled)
+
+    def resizeEvent(self, event):
+        """Rescale cheaply during the drag; smooth once it settles."""
+        super().resizeEvent(event)
+        if self._displayed is not None:
+            self._apply_scaled(smooth=False)
+            self._rescale_timer.start()
+
     def update_info_display(self):
         """Update the information display."""
         if self.current_automaton is None:
             return
         
-        info = f"Type: {type(self.current_automaton).__name__}\n"
-        info += f"States: {self.current_automaton.get_state_count()}\n"
-        info += f"Transitions: {self.current_automaton.get_transition_count()}\n"
-        info += f"Alphabet: {{{', '.join(sorted(self.current_automaton.alphabet))}}}\n"
-        info += f"Start State: {self.current_automaton.start_state}\n"
-        info += f"Accept States: {{{', '.join(sorted(self.current_automaton.accept_states))}}}\n"
-        
+        # One f-string, one allocation — no repeated str concatenation
+        automaton = self.current_automaton
+        info = (
+            f"Type: {type(automaton).__name__}\n"
+            f"States: {automaton.get_state_count()}\n"
+            f"Transitions: {automaton.get_transition_count()}\n"
+            f"Alphabet: {{{', '.join(automaton.sorted_alphabet())}}}\n"
+            f"Start State: {automaton.start_state}\n"
+            f"Accept States: {{{', '.join(automaton.sorted_accept_states())}}}\n"
+        )
+
         self.info_text.setText(info)
     
     def run_simulation(self, input_string: str):
@@ -385,6 +502,26 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Error", f"Minimization failed:\n{str(e)}")
     
+    def convert_pipeline_regex_to_min_dfa(self):
+        """Convert regex straight to a minimized DFA in one shot.
+
+        Chains all four stages without the intermediate renders the
+        step-by-step menu entries trigger, so Graphviz runs once instead
+        of four times.
+        """
+        dialog = InputDialog("Enter Regular Expression", "Regex:", self)
+        if dialog.exec():
+            regex = dialog.get_input()
+            try:
+                enfa = thompson_construction(regex)
+                nfa = epsilon_nfa_to_nfa(enfa)
+                dfa = nfa_to_dfa(nfa)
+                self.current_automaton = minimize_dfa(dfa)
+                self.visualize_current_automaton()
+                self.statusBar().showMessage("Converted regex to minimized DFA")
+            except Exception as e:
+                QtWidgets.QMessageBox.critical(self, "Error", f"Conversion failed:\n{str(e)}")
+
     def convert_mealy_to_moore(self):
         """Convert Mealy to Moore."""
         if self.current_automaton is None:
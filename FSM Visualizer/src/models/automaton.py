@@ -1,13 +1,65 @@
 """Base classes for automaton models."""
 
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Set, Dict, List, Optional, Any
+from typing import Set, Dict, List, Optional, Any, Callable
 from abc import ABC, abstractmethod
 
 
-@dataclass
+class _TransitionView(Mapping):
+    """Read-only nested view over a flat (state, symbol) table.
+
+    get_transition_function used to rebuild the whole nested dict on
+    every call even when the caller (typically visualization code)
+    reads a single state's row. This translates rows on demand and
+    caches them for the view's lifetime, so each call allocates O(1)
+    up front instead of O(|δ|). An optional value transform adapts the
+    stored entries to the shape each machine type exposes.
+    """
+    __slots__ = ('_table', '_value', '_rows', '_sources')
+
+    def __init__(self, table: Dict[tuple, Any],
+                 value: Optional[Callable[[Any], Any]] = None):
+        self._table = table
+        self._value = value
+        self._rows: Dict[str, dict] = {}
+        self._sources: Optional[Set[str]] = None
+
+    def _index(self) -> Set[str]:
+        if self._sources is None:
+            self._sources = {from_state for (from_state, _) in self._table}
+        return self._sources
+
+    def __getitem__(self, from_state: str) -> dict:
+        row = self._rows.get(from_state)
+        if row is None:
+            value = self._value
+            row = {
+                symbol: value(entry) if value is not None else entry
+                for (source, symbol), entry in self._table.items()
+                if source == from_state
+            }
+            if not row:
+                raise KeyError(from_state)
+            self._rows[from_state] = row
+        return row
+
+    def __iter__(self):
+        return iter(self._index())
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+
+@dataclass(slots=True)
 class State:
-    """Represents a state in an automaton."""
+    """Represents a state in an automaton.
+
+    Slotted: automata allocate one of these per state and the hot
+    conversion paths touch is_accept/is_start constantly, so fixed
+    offsets beat a per-instance __dict__.
+    """
     name: str
     is_accept: bool = False
     is_start: bool = False
@@ -24,7 +76,7 @@ class State:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class Transition:
     """Represents a transition in an automaton."""
     from_state: str
@@ -45,12 +97,25 @@ class Automaton(ABC):
         self.start_state: Optional[str] = None
         self.accept_states: Set[str] = set()
         self.transitions: List[Transition] = []
+        # Lazily cached sorted views for display code; see the accessors
+        self._sorted_alphabet: tuple = ()
+        self._sorted_accept_states: tuple = ()
+        self._accept_states_snapshot: frozenset = frozenset()
+        # Dense integer ids, assigned in add_state order. Hot paths key
+        # their internal tables on these light ints; names stay the
+        # public currency at the API boundary.
+        self._name_to_id: Dict[str, int] = {}
+        self._id_to_name: List[str] = []
     
     def add_state(self, name: str, is_accept: bool = False, is_start: bool = False) -> State:
         """Add a state to the automaton."""
         state = State(name, is_accept, is_start)
         self.states[name] = state
-        
+
+        if name not in self._name_to_id:
+            self._name_to_id[name] = len(self._id_to_name)
+            self._id_to_name.append(name)
+
         if is_accept:
             self.accept_states.add(name)
         if is_start:
@@ -60,6 +125,11 @@ class Automaton(ABC):
     
     def add_transition(self, from_state: str, to_state: str, symbol: str, output: Optional[str] = None):
         """Add a transition to the automaton."""
+        # Intern the symbol: alphabets are tiny and transitions many, so
+        # every transition-table key for a symbol is the same object and
+        # dict lookups hit the pointer-equality fast path.
+        symbol = sys.intern(symbol)
+
         if symbol != 'ε':  # Don't add epsilon to alphabet
             self.alphabet.add(symbol)
         
@@ -96,6 +166,29 @@ class Automaton(ABC):
         
         return True, "Valid"
     
+    def sorted_alphabet(self) -> tuple:
+        """Alphabet as a sorted tuple, cached between calls.
+
+        Symbols are only ever added, never removed, so comparing
+        lengths is a sufficient staleness check and repeated UI
+        refreshes skip the O(n log n) sort.
+        """
+        if len(self._sorted_alphabet) != len(self.alphabet):
+            self._sorted_alphabet = tuple(sorted(self.alphabet))
+        return self._sorted_alphabet
+
+    def sorted_accept_states(self) -> tuple:
+        """Accept states as a sorted tuple, cached like sorted_alphabet.
+
+        Unlike the alphabet, accept_states is swapped in place by the
+        conversion code, so staleness is checked against a snapshot of
+        the set rather than its length.
+        """
+        if self._accept_states_snapshot != self.accept_states:
+            self._accept_states_snapshot = frozenset(self.accept_states)
+            self._sorted_accept_states = tuple(sorted(self.accept_states))
+        return self._sorted_accept_states
+
     def get_state_count(self) -> int:
         """Return the number of states."""
         return len(self.states)
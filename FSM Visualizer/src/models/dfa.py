@@ -1,24 +1,92 @@
 """Deterministic Finite Automaton (DFA) implementation."""
 
+import sys
+from collections.abc import Mapping
 from typing import Dict, Optional, List, Tuple
-from .automaton import Automaton
+from .automaton import Automaton, _TransitionView
 
 
 class DFA(Automaton):
     """Deterministic Finite Automaton."""
-    
+
     def __init__(self):
         super().__init__()
         self._transition_table: Dict[Tuple[str, str], str] = {}
-    
+        self._dense = None
+
     def add_transition(self, from_state: str, to_state: str, symbol: str, output: Optional[str] = None):
         """Add a transition (must be deterministic)."""
+        symbol = sys.intern(symbol)  # keep table keys pointer-comparable
         key = (from_state, symbol)
         if key in self._transition_table:
             raise ValueError(f"DFA transition already exists: {from_state} --{symbol}--> (multiple states)")
-        
+
         super().add_transition(from_state, to_state, symbol, output)
         self._transition_table[key] = to_state
+        self._dense = None
+
+    def _dense_tables(self) -> tuple:
+        """Return (sym_to_id, table, accept): a dense walker for accepts.
+
+        table[state_id][sym_id] is the next state id or -1, so the hot
+        loop is two list indexings per character instead of hashing a
+        (state, symbol) tuple; accept[state_id] folds the final
+        set-membership test into one more indexing. Rebuilt lazily
+        after mutation — also when a state was added or the public
+        accept_states set was changed since the last build, which a
+        pure add_transition hook would miss. accept_states is compared
+        against a snapshot, not its length: the conversion code swaps
+        members in place, so same-cardinality edits are real changes.
+        """
+        if (self._dense is None
+                or len(self._dense[1]) != len(self._id_to_name)
+                or self._dense[3] != self.accept_states):
+            name_to_id = self._name_to_id
+            sym_to_id = {sym: i for i, sym in enumerate(self.alphabet)}
+            n_symbols = len(sym_to_id)
+
+            table = [[-1] * n_symbols for _ in self._id_to_name]
+            for (state, symbol), dst in self._transition_table.items():
+                sid = sym_to_id.get(symbol)
+                if sid is None:
+                    # ε-labelled rows are kept out of the alphabet and
+                    # can never match an input character; the tuple-keyed
+                    # walk ignored them, so the dense table does too
+                    continue
+                table[name_to_id[state]][sid] = name_to_id[dst]
+
+            accept = [name in self.accept_states for name in self._id_to_name]
+
+            # States shaped like a self-loop with at most one escape
+            # symbol (b* with an optional exit) can be fast-forwarded
+            # with C-level str.find/str.count instead of stepping the
+            # loop one character at a time. Only single-character
+            # symbols qualify, since the scan works on the raw string.
+            symbols = list(sym_to_id)
+            loops = {}
+            for s, row in enumerate(table):
+                loop_sym = escape = None
+                eligible = True
+                for sid, dst in enumerate(row):
+                    if dst < 0:
+                        continue
+                    if dst == s:
+                        if loop_sym is not None:
+                            eligible = False
+                            break
+                        loop_sym = symbols[sid]
+                    else:
+                        if escape is not None:
+                            eligible = False
+                            break
+                        escape = (symbols[sid], dst)
+                if (eligible and loop_sym is not None and len(loop_sym) == 1
+                        and (escape is None or len(escape[0]) == 1)):
+                    loops[s] = (loop_sym, escape[0] if escape else None,
+                                escape[1] if escape else -1)
+
+            self._dense = (sym_to_id, table, accept, frozenset(self.accept_states), loops)
+        return self._dense
     
     def get_next_state(self, current_state: str, symbol: str) -> Optional[str]:
         """Get the next state for a given state and symbol."""
@@ -28,48 +96,110 @@ class DFA(Automaton):
         """Check if the DFA accepts the input string."""
         if self.start_state is None:
             return False
-        
-        current_state = self.start_state
-        
-        for symbol in input_string:
-            next_state = self.get_next_state(current_state, symbol)
-            if next_state is None:
+
+        # Walk the dense table: two list indexings per character, with
+        # symbols resolved to small ints through one dict.get
+        sym_to_id, table, accept, _, loops = self._dense_tables()
+        sid_get = sym_to_id.get
+        loops_get = loops.get
+        current = self._name_to_id[self.start_state]
+        i = 0
+        n = len(input_string)
+
+        while i < n:
+            fast = loops_get(current)
+            if fast is not None:
+                # Self-loop state: skip the homogeneous run with a
+                # C-level scan for the escape symbol, then verify the
+                # run really was all loop characters
+                loop_sym, escape_sym, escape_dst = fast
+                j = input_string.find(escape_sym, i) if escape_sym else -1
+                if j < 0:
+                    return (accept[current]
+                            if input_string.count(loop_sym, i) == n - i
+                            else False)
+                if input_string.count(loop_sym, i, j) != j - i:
+                    return False
+                current = escape_dst
+                i = j + 1
+                continue
+
+            sid = sid_get(input_string[i])
+            if sid is None:
                 return False
-            current_state = next_state
-        
-        return current_state in self.accept_states
-    
-    def simulate_step_by_step(self, input_string: str) -> List[Tuple[str, str, str]]:
+            current = table[current][sid]
+            if current < 0:
+                return False
+            i += 1
+
+        return accept[current]
+
+    def accepts_many(self, input_strings) -> List[bool]:
+        """Check a batch of inputs against the DFA.
+
+        Builds the dense walker once and hoists the per-call setup out
+        of the loop, so bulk validation pays the table and lookup
+        binding costs a single time instead of per string.
         """
-        Simulate the DFA step by step.
-        Returns a list of (current_state, symbol, next_state) tuples.
+        if self.start_state is None:
+            return [False for _ in input_strings]
+
+        sym_to_id, table, accept, _, _ = self._dense_tables()
+        sid_get = sym_to_id.get
+        start = self._name_to_id[self.start_state]
+
+        results = []
+        append = results.append
+        for input_string in input_strings:
+            current = start
+            alive = True
+            for symbol in input_string:
+                sid = sid_get(symbol)
+                if sid is None:
+                    alive = False
+                    break
+                current = table[current][sid]
+                if current < 0:
+                    alive = False
+                    break
+            append(accept[current] if alive else False)
+        return results
+
+    def run(self, input_string: str) -> Tuple[bool, List[Tuple[str, str, str]]]:
+        """Walk the input once, returning (accepted, steps).
+
+        One traversal serves callers that want both the verdict and
+        the trace; accepts stays the fast path when only the verdict
+        is needed.
         """
         if self.start_state is None:
-            return []
-        
+            return False, []
+
+        tt_get = self._transition_table.get
         steps = []
+        append = steps.append
         current_state = self.start_state
-        
+
         for symbol in input_string:
-            next_state = self.get_next_state(current_state, symbol)
+            next_state = tt_get((current_state, symbol))
             if next_state is None:
-                steps.append((current_state, symbol, "REJECT"))
-                break
-            steps.append((current_state, symbol, next_state))
+                append((current_state, symbol, "REJECT"))
+                return False, steps
+            append((current_state, symbol, next_state))
             current_state = next_state
-        
-        return steps
+
+        return current_state in self.accept_states, steps
+
+    def simulate_step_by_step(self, input_string: str) -> List[Tuple[str, str, str]]:
+        """
+        Simulate the DFA step by step.
+        Returns a list of (current_state, symbol, next_state) tuples.
+        """
+        return self.run(input_string)[1]
     
-    def get_transition_function(self) -> Dict[str, Dict[str, str]]:
-        """Return the transition function as a nested dictionary."""
-        result = {}
-        
-        for (from_state, symbol), to_state in self._transition_table.items():
-            if from_state not in result:
-                result[from_state] = {}
-            result[from_state][symbol] = to_state
-        
-        return result
+    def get_transition_function(self) -> Mapping:
+        """Return the transition function as a lazy nested mapping."""
+        return _TransitionView(self._transition_table)
     
     def validate(self) -> tuple[bool, str]:
         """Validate DFA-specific properties."""
@@ -89,8 +219,13 @@ class DFA(Automaton):
     
     def is_complete(self) -> bool:
         """Check if the DFA is complete (all transitions defined)."""
-        for state in self.states:
-            for symbol in self.alphabet:
-                if (state, symbol) not in self._transition_table:
-                    return False
-        return True
+        # add_transition rejects duplicate (state, symbol) keys, so the
+        # table is complete exactly when it holds one in-domain entry
+        # per (state, symbol) pair. Out-of-domain keys — ε-labelled
+        # rows and transitions from undeclared states — can reach the
+        # table and must not be counted toward completeness.
+        states = self.states
+        alphabet = self.alphabet
+        defined = sum(1 for (state, symbol) in self._transition_table
+                      if state in states and symbol in alphabet)
+        return defined == len(states) * len(alphabet)
@@ -1,8 +1,14 @@
 """Non-deterministic Finite Automaton (NFA) and ε-NFA implementation."""
 
+import sys
+from collections.abc import Mapping
 from typing import Dict, Set, List, Tuple, Optional
 from collections import defaultdict, deque
-from .automaton import Automaton
+from .automaton import Automaton, _TransitionView
+
+# Shared empty result for lookups that have no transition; avoids
+# allocating a fresh set per miss
+_EMPTY: frozenset = frozenset()
 
 
 class NFA(Automaton):
@@ -11,139 +17,397 @@ class NFA(Automaton):
     def __init__(self):
         super().__init__()
         self._transition_table: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
-    
+        self._csr = None
+        self._bit_trans = None
+        self._ftt = None
+
+    def add_state(self, name: str, is_accept: bool = False, is_start: bool = False):
+        """Add a state; also drops the frozen transition views.
+
+        The cached CSR aliases the live id containers, so a state
+        added after finalize() would otherwise be iterated against the
+        old offsets array.
+        """
+        self._csr = None
+        self._bit_trans = None
+        self._ftt = None
+        return super().add_state(name, is_accept, is_start)
+
     def add_transition(self, from_state: str, to_state: str, symbol: str, output: Optional[str] = None):
         """Add a transition (can be non-deterministic)."""
+        symbol = sys.intern(symbol)  # keep table keys pointer-comparable
         super().add_transition(from_state, to_state, symbol, output)
         self._transition_table[(from_state, symbol)].add(to_state)
+        self._csr = None
+        self._bit_trans = None
+        self._ftt = None
+
+    def _frozen_table(self) -> List[List[frozenset]]:
+        """Freeze transitions into a 2-D list indexed [state_id][sym_id].
+
+        The defaultdict is the right shape while the NFA is being
+        built, but once simulation starts the table is read-only, so
+        lookups become two list indexings into immutable frozensets
+        instead of hashing a (state, symbol) tuple. Built lazily from
+        the CSR view and invalidated alongside it.
+        """
+        if self._ftt is None:
+            states_list, _, symbols, _, offsets, syms, dsts = self.finalize()
+            n_symbols = len(symbols)
+
+            rows = []
+            for state in range(len(states_list)):
+                targets: Dict[int, set] = {}
+                for k in range(offsets[state], offsets[state + 1]):
+                    targets.setdefault(syms[k], set()).add(states_list[dsts[k]])
+                row = [_EMPTY] * n_symbols
+                for sid, dst_names in targets.items():
+                    row[sid] = frozenset(dst_names)
+                rows.append(row)
+            self._ftt = rows
+        return self._ftt
+
+    def _bit_tables(self) -> Dict[str, List[int]]:
+        """Per-symbol successor masks: _bit_tables()[sym][state_id] is
+        the OR of 1 << target_id over that state's transitions.
+
+        With state sets packed into Python ints, one simulation step is
+        a handful of bignum ORs regardless of fan-out. Built lazily
+        from the CSR view and invalidated alongside it.
+        """
+        if self._bit_trans is None:
+            _, _, symbols, _, offsets, syms, dsts = self.finalize()
+            n_states = len(self._id_to_name)
+            tables: Dict[str, List[int]] = {}
+            for state in range(n_states):
+                for k in range(offsets[state], offsets[state + 1]):
+                    tbl = tables.get(symbols[syms[k]])
+                    if tbl is None:
+                        tbl = tables[symbols[syms[k]]] = [0] * n_states
+                    tbl[state] |= 1 << dsts[k]
+            self._bit_trans = tables
+        return self._bit_trans
+
+    def finalize(self) -> tuple:
+        """Freeze the transitions into a CSR-style indexed view.
+
+        Returns (states_list, index_of, symbols, sym_id, offsets, syms,
+        dsts): the transitions leaving state i occupy the contiguous
+        slice offsets[i]:offsets[i+1] of the parallel syms/dsts lists,
+        with states and symbols mapped to dense ints. Alphabet symbols
+        take the first ids; ε (not part of the alphabet) is appended
+        after them. Cached until the next add_transition, so conversion
+        algorithms can iterate flat slices instead of probing the
+        per-(state, symbol) hash table.
+        """
+        if self._csr is not None:
+            return self._csr
+
+        # Reuse the dense ids assigned by add_state
+        states_list = self._id_to_name
+        index_of = self._name_to_id
+        symbols = list(self.alphabet)
+        sym_id = {sym: i for i, sym in enumerate(symbols)}
+        n_states = len(states_list)
+        n_trans = len(self.transitions)
+
+        # Counting sort by source state: one pass to size each row,
+        # prefix-sum, then one pass to fill
+        offsets = [0] * (n_states + 1)
+        for trans in self.transitions:
+            offsets[index_of[trans.from_state] + 1] += 1
+        for i in range(1, n_states + 1):
+            offsets[i] += offsets[i - 1]
+
+        cursor = offsets[:-1]
+        syms = [0] * n_trans
+        dsts = [0] * n_trans
+        for trans in self.transitions:
+            sid = sym_id.get(trans.symbol)
+            if sid is None:
+                sid = len(symbols)
+                sym_id[trans.symbol] = sid
+                symbols.append(trans.symbol)
+            src = index_of[trans.from_state]
+            pos = cursor[src]
+            cursor[src] = pos + 1
+            syms[pos] = sid
+            dsts[pos] = index_of[trans.to_state]
+
+        self._csr = (states_list, index_of, symbols, sym_id, offsets, syms, dsts)
+        return self._csr
     
-    def get_next_states(self, current_state: str, symbol: str) -> Set[str]:
+    def get_next_states(self, current_state: str, symbol: str) -> frozenset:
         """Get all possible next states for a given state and symbol."""
-        return self._transition_table.get((current_state, symbol), set())
+        _, index_of, _, sym_id, _, _, _ = self.finalize()
+        sid = sym_id.get(symbol)
+        state_id = index_of.get(current_state)
+        if sid is None or state_id is None:
+            return _EMPTY
+        return self._frozen_table()[state_id][sid]
     
     def accepts(self, input_string: str) -> bool:
         """Check if the NFA accepts the input string."""
         if self.start_state is None:
             return False
-        
-        current_states = {self.start_state}
-        
+
+        # Frontier as a bitmask: one bit per state, stepped by ORing
+        # the per-symbol successor masks of every set bit
+        tables = self._bit_tables()
+        index_of = self._name_to_id
+        frontier = 1 << index_of[self.start_state]
+
         for symbol in input_string:
-            next_states = set()
-            for state in current_states:
-                next_states.update(self.get_next_states(state, symbol))
-            
-            if not next_states:
+            tbl = tables.get(symbol)
+            if tbl is None:
                 return False
-            
-            current_states = next_states
-        
-        return bool(current_states & self.accept_states)
+
+            step = 0
+            bits = frontier
+            while bits:
+                low = bits & -bits
+                step |= tbl[low.bit_length() - 1]
+                bits ^= low
+
+            if not step:
+                return False
+            frontier = step
+
+        accept_mask = 0
+        for state in self.accept_states:
+            accept_mask |= 1 << index_of[state]
+        return bool(frontier & accept_mask)
     
-    def simulate_step_by_step(self, input_string: str) -> List[Tuple[Set[str], str, Set[str]]]:
-        """
-        Simulate the NFA step by step.
-        Returns a list of (current_states, symbol, next_states) tuples.
+    def run(self, input_string: str) -> Tuple[bool, List[Tuple[Set[str], str, Set[str]]]]:
+        """Walk the input once, returning (accepted, steps).
+
+        One traversal serves callers that want both the verdict and
+        the trace; accepts stays the fast path when only the verdict
+        is needed.
         """
         if self.start_state is None:
-            return []
-        
+            return False, []
+
         steps = []
         current_states = {self.start_state}
-        
+
         for symbol in input_string:
             next_states = set()
             for state in current_states:
                 next_states.update(self.get_next_states(state, symbol))
-            
-            steps.append((current_states.copy(), symbol, next_states.copy()))
-            
+
+            # Frozen snapshots: nothing mutates these sets after this
+            # point, so no defensive copy is needed and the recorded
+            # steps are immutable
+            steps.append((frozenset(current_states), symbol, frozenset(next_states)))
+
             if not next_states:
-                break
-            
+                return False, steps
+
             current_states = next_states
-        
-        return steps
+
+        return not self.accept_states.isdisjoint(current_states), steps
+
+    def simulate_step_by_step(self, input_string: str) -> List[Tuple[Set[str], str, Set[str]]]:
+        """
+        Simulate the NFA step by step.
+        Returns a list of (current_states, symbol, next_states) tuples.
+        """
+        return self.run(input_string)[1]
     
-    def get_transition_function(self) -> Dict[str, Dict[str, List[str]]]:
-        """Return the transition function as a nested dictionary."""
-        result = {}
-        
-        for (from_state, symbol), to_states in self._transition_table.items():
-            if from_state not in result:
-                result[from_state] = {}
-            result[from_state][symbol] = list(to_states)
-        
-        return result
+    def get_transition_function(self) -> Mapping:
+        """Return the transition function as a lazy nested mapping."""
+        return _TransitionView(self._transition_table, value=list)
+
+    def trimmed(self) -> 'NFA':
+        """Copy of this automaton without dead states.
+
+        A state survives if it is reachable from the start and can
+        reach an accept state (ε edges count); everything else only
+        inflates the frontier during simulation. The start state is
+        always kept so the result is a valid automaton even when the
+        language is empty. Returns self unchanged when nothing is
+        dead.
+        """
+        if self.start_state is None:
+            return self
+
+        forward = defaultdict(list)
+        backward = defaultdict(list)
+        for trans in self.transitions:
+            forward[trans.from_state].append(trans.to_state)
+            backward[trans.to_state].append(trans.from_state)
+
+        def bfs(seeds, adj):
+            seen = set(seeds)
+            queue = deque(seeds)
+            while queue:
+                state = queue.popleft()
+                for nxt in adj.get(state, ()):
+                    if nxt not in seen:
+                        seen.add(nxt)
+                        queue.append(nxt)
+            return seen
+
+        keep = bfs((self.start_state,), forward) & bfs(tuple(self.accept_states), backward)
+        keep.add(self.start_state)
+
+        if len(keep) == len(self.states):
+            return self
+
+        trimmed = type(self)()
+        for name in self._id_to_name:
+            if name in keep:
+                trimmed.add_state(name, is_accept=name in self.accept_states,
+                                  is_start=name == self.start_state)
+        for trans in self.transitions:
+            if trans.from_state in keep and trans.to_state in keep:
+                trimmed.add_transition(trans.from_state, trans.to_state,
+                                       trans.symbol, trans.output)
+        # The declared alphabet survives even if some symbols now have
+        # no transitions
+        trimmed.alphabet.update(self.alphabet)
+        return trimmed
 
 
 class EpsilonNFA(NFA):
     """ε-NFA (NFA with epsilon transitions)."""
-    
+
+    def __init__(self):
+        super().__init__()
+        self._eps_closure_masks = None
+
+    def add_state(self, name: str, is_accept: bool = False, is_start: bool = False):
+        """Add a state; also drops the cached ε-closure table, whose
+        mask list is sized to the state count."""
+        self._eps_closure_masks = None
+        return super().add_state(name, is_accept, is_start)
+
+    def add_transition(self, from_state: str, to_state: str, symbol: str, output: Optional[str] = None):
+        """Add a transition; also drops the cached ε-closure table."""
+        super().add_transition(from_state, to_state, symbol, output)
+        self._eps_closure_masks = None
+
+    def _closure_table(self) -> List[int]:
+        """Per-state ε-closure bitmasks, computed once per ε-graph.
+
+        The ε-graph is fixed during simulation, so every closure query
+        after the first build is mask lookups and ORs instead of a BFS
+        per step. Iterates masks to a fixed point; closures propagate
+        through cycles (a*-style loops) until stable.
+        """
+        if self._eps_closure_masks is None:
+            n_states = len(self._id_to_name)
+            eps = self._bit_tables().get('ε')
+
+            masks = [(1 << i) | (eps[i] if eps else 0) for i in range(n_states)]
+            changed = eps is not None
+            while changed:
+                changed = False
+                for i in range(n_states):
+                    mask = masks[i]
+                    new = mask
+                    bits = mask
+                    while bits:
+                        low = bits & -bits
+                        new |= masks[low.bit_length() - 1]
+                        bits ^= low
+                    if new != mask:
+                        masks[i] = new
+                        changed = True
+
+            self._eps_closure_masks = masks
+        return self._eps_closure_masks
+
     def epsilon_closure(self, states: Set[str]) -> Set[str]:
         """Compute the epsilon closure of a set of states."""
-        closure = set(states)
-        queue = deque(states)
-        
-        while queue:
-            state = queue.popleft()
-            epsilon_transitions = self.get_next_states(state, 'ε')
-            
-            for next_state in epsilon_transitions:
-                if next_state not in closure:
-                    closure.add(next_state)
-                    queue.append(next_state)
-        
+        masks = self._closure_table()
+        index_of = self._name_to_id
+        names = self._id_to_name
+
+        mask = 0
+        for state in states:
+            mask |= masks[index_of[state]]
+
+        closure = set()
+        bits = mask
+        while bits:
+            low = bits & -bits
+            closure.add(names[low.bit_length() - 1])
+            bits ^= low
+
         return closure
-    
+
     def accepts(self, input_string: str) -> bool:
         """Check if the ε-NFA accepts the input string."""
         if self.start_state is None:
             return False
-        
-        # Start with epsilon closure of start state
-        current_states = self.epsilon_closure({self.start_state})
-        
+
+        # Same bitmask stepping as the NFA, with an ε-closure OR pass
+        # over the cached table after each symbol
+        masks = self._closure_table()
+        tables = self._bit_tables()
+        index_of = self._name_to_id
+        frontier = masks[index_of[self.start_state]]
+
         for symbol in input_string:
-            next_states = set()
-            for state in current_states:
-                # Get states reachable by the symbol
-                symbol_states = self.get_next_states(state, symbol)
-                next_states.update(symbol_states)
-            
-            if not next_states:
+            tbl = tables.get(symbol)
+            if tbl is None:
+                return False
+
+            step = 0
+            bits = frontier
+            while bits:
+                low = bits & -bits
+                step |= tbl[low.bit_length() - 1]
+                bits ^= low
+
+            if not step:
                 return False
-            
-            # Apply epsilon closure to the result
-            current_states = self.epsilon_closure(next_states)
-        
-        return bool(current_states & self.accept_states)
+
+            closed = 0
+            bits = step
+            while bits:
+                low = bits & -bits
+                closed |= masks[low.bit_length() - 1]
+                bits ^= low
+            frontier = closed
+
+        accept_mask = 0
+        for state in self.accept_states:
+            accept_mask |= 1 << index_of[state]
+        return bool(frontier & accept_mask)
     
-    def simulate_step_by_step(self, input_string: str) -> List[Tuple[Set[str], str, Set[str]]]:
-        """
-        Simulate the ε-NFA step by step with epsilon closures.
-        Returns a list of (current_states_with_ε, symbol, next_states_with_ε) tuples.
-        """
+    def run(self, input_string: str) -> Tuple[bool, List[Tuple[Set[str], str, Set[str]]]]:
+        """Walk the input once with ε-closures, returning (accepted, steps)."""
         if self.start_state is None:
-            return []
-        
+            return False, []
+
         steps = []
         current_states = self.epsilon_closure({self.start_state})
-        
+
         for symbol in input_string:
             next_states = set()
             for state in current_states:
                 next_states.update(self.get_next_states(state, symbol))
-            
+
             next_states_with_epsilon = self.epsilon_closure(next_states)
-            steps.append((current_states.copy(), symbol, next_states_with_epsilon.copy()))
-            
+            steps.append((frozenset(current_states), symbol,
+                          frozenset(next_states_with_epsilon)))
+
             if not next_states_with_epsilon:
-                break
-            
+                return False, steps
+
             current_states = next_states_with_epsilon
-        
-        return steps
+
+        return not self.accept_states.isdisjoint(current_states), steps
+
+    def simulate_step_by_step(self, input_string: str) -> List[Tuple[Set[str], str, Set[str]]]:
+        """
+        Simulate the ε-NFA step by step with epsilon closures.
+        Returns a list of (current_states_with_ε, symbol, next_states_with_ε) tuples.
+        """
+        return self.run(input_string)[1]
     
     def get_all_epsilon_transitions(self) -> List[Tuple[str, str]]:
         """Get all epsilon transitions as (from_state, to_state) pairs."""
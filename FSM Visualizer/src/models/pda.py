@@ -1,5 +1,6 @@
 """Pushdown Automaton (PDA) implementation."""
 
+from collections import defaultdict, deque
 from typing import Dict, Set, List, Tuple, Optional
 from dataclasses import dataclass
 from .automaton import Automaton
@@ -13,21 +14,70 @@ class PDATransition:
     input_symbol: str  # Can be 'ε' for epsilon
     stack_pop: str     # Symbol to pop from stack
     stack_push: List[str]  # Symbols to push (in order, top first)
-    
+
+    def __post_init__(self):
+        # Push sequence reversed into bottom-first order, with ε markers
+        # dropped; pushing these one by one leaves stack_push[0] on top
+        self._push_rev = tuple(s for s in reversed(self.stack_push) if s != 'ε')
+        # Decided once here so the hot loops test a bool attribute
+        # instead of comparing against 'ε' per step
+        self.input_is_epsilon = self.input_symbol == 'ε'
+
     def __str__(self):
         push_str = ''.join(self.stack_push) if self.stack_push else 'ε'
         return f"{self.from_state} --{self.input_symbol},{self.stack_pop}/{push_str}--> {self.to_state}"
 
 
+class StackNode:
+    """One cell of a persistent PDA stack, top at the head.
+
+    Pushing makes a new head and shares the rest, so sibling
+    configurations reuse storage, and the structural hash is combined
+    incrementally at construction — hashing a visited-set key is O(1)
+    no matter how deep the stack is, instead of rehashing a whole
+    tuple per step.
+    """
+    __slots__ = ('top', 'rest', '_h')
+
+    def __init__(self, top: str, rest: Optional['StackNode']):
+        self.top = top
+        self.rest = rest
+        self._h = hash((top, rest._h if rest is not None else 0))
+
+    def __hash__(self):
+        return self._h
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, StackNode):
+            return NotImplemented
+        # Shared tails are common, so walk until the nodes are the
+        # same object (or provably different)
+        a, b = self, other
+        while a is not b:
+            if a is None or b is None or a._h != b._h or a.top != b.top:
+                return False
+            a, b = a.rest, b.rest
+        return True
+
+    def __iter__(self):
+        node = self
+        while node is not None:
+            yield node.top
+            node = node.rest
+
+
 @dataclass
 class PDAConfiguration:
     """Represents a configuration (state, remaining input, stack)."""
     state: str
     remaining_input: str
-    stack: List[str]  # Top of stack at index 0
-    
+    stack: Optional[StackNode]  # Top of stack at the head; None if empty
+
     def __str__(self):
-        stack_str = ''.join(self.stack) if self.stack else '⊥'
+        # The node list is already top-first, the conventional order
+        stack_str = ''.join(self.stack) if self.stack is not None else '⊥'
         return f"({self.state}, {self.remaining_input or 'ε'}, {stack_str})"
 
 
@@ -39,6 +89,10 @@ class PDA(Automaton):
         self.stack_alphabet: Set[str] = set()
         self.start_stack_symbol: str = 'Z'  # Default start symbol
         self._pda_transitions: List[PDATransition] = []
+        # Transitions bucketed by (from_state, input_symbol, stack_pop)
+        # so each BFS step is two dict probes — one for the current
+        # symbol, one for ε moves — with no per-step filtering
+        self._trans_index: Dict[Tuple[str, str, str], List[PDATransition]] = defaultdict(list)
     
     def add_pda_transition(self, from_state: str, to_state: str, input_symbol: str,
                           stack_pop: str, stack_push: List[str]):
@@ -55,6 +109,7 @@ class PDA(Automaton):
         
         transition = PDATransition(from_state, to_state, input_symbol, stack_pop, stack_push)
         self._pda_transitions.append(transition)
+        self._trans_index[(from_state, input_symbol, stack_pop)].append(transition)
         
         # Also add to base transitions for visualization
         label = f"{input_symbol},{stack_pop}/{''.join(stack_push) if stack_push else 'ε'}"
@@ -63,21 +118,89 @@ class PDA(Automaton):
     def get_applicable_transitions(self, state: str, input_symbol: Optional[str],
                                    stack_top: Optional[str]) -> List[PDATransition]:
         """Get all transitions applicable to current configuration."""
-        applicable = []
-        
-        for trans in self._pda_transitions:
-            if trans.from_state != state:
-                continue
-            
-            if stack_top is None or trans.stack_pop != stack_top:
-                continue
-            
-            # Transition can read current input or be epsilon
-            if trans.input_symbol == input_symbol or trans.input_symbol == 'ε':
-                applicable.append(trans)
-        
-        return applicable
+        if stack_top is None:
+            return []
+
+        # Exact-symbol bucket first, then ε moves; no scan or filter
+        index_get = self._trans_index.get
+        exact = (index_get((state, input_symbol, stack_top))
+                 if input_symbol is not None and input_symbol != 'ε' else None)
+        eps = index_get((state, 'ε', stack_top))
+
+        if exact and eps:
+            return exact + eps
+        return exact or eps or []
     
+    # Exploration cap for the acceptance search: ε-transitions that
+    # grow the stack can yield infinitely many distinct
+    # configurations, so BFS needs a bound to terminate on such
+    # machines. Generous enough that any reasonable classroom PDA
+    # decides well before hitting it.
+    MAX_CONFIGS = 100000
+
+    def run(self, input_string: str) -> Tuple[bool, List[Tuple[PDAConfiguration, Optional[PDATransition]]]]:
+        """Decide acceptance and produce a display path in one search.
+
+        BFS with parent links over (state, position, stack) tuples:
+        when an accepting configuration is found, the links are walked
+        back to reconstruct the accepting computation. On reject the
+        greedy simulate_step_by_step path is shown instead, since no
+        single path demonstrates the failure. Exploration stops after
+        MAX_CONFIGS expansions, treating the input as rejected.
+        """
+        if self.start_state is None:
+            return False, []
+
+        n = len(input_string)
+        initial = (self.start_state, 0,
+                   StackNode(self.start_stack_symbol, None))
+        queue = deque((initial,))
+        # Doubles as the visited set: key -> (parent_key, transition)
+        parents = {initial: None}
+        accept_states = self.accept_states
+        budget = self.MAX_CONFIGS
+
+        while queue and budget:
+            budget -= 1
+            key = queue.popleft()
+            state, pos, stack = key
+
+            if pos == n and state in accept_states:
+                return True, self._reconstruct_path(parents, key, input_string)
+
+            if stack is None:
+                continue
+
+            current_symbol = input_string[pos] if pos < n else None
+            for trans in self.get_applicable_transitions(state, current_symbol, stack.top):
+                new_stack = stack.rest
+                for symbol in trans._push_rev:
+                    new_stack = StackNode(symbol, new_stack)
+                new_pos = pos if trans.input_is_epsilon else pos + 1
+
+                new_key = (trans.to_state, new_pos, new_stack)
+                if new_key in parents:
+                    continue
+                parents[new_key] = (key, trans)
+                queue.append(new_key)
+
+        return False, self.simulate_step_by_step(input_string)
+
+    def _reconstruct_path(self, parents, key, input_string):
+        """Walk parent links back from an accepting configuration."""
+        path = []
+        while True:
+            state, pos, stack = key
+            config = PDAConfiguration(state, input_string[pos:], stack)
+            entry = parents[key]
+            if entry is None:
+                path.append((config, None))
+                break
+            key, trans = entry
+            path.append((config, trans))
+        path.reverse()
+        return path
+
     def accepts(self, input_string: str) -> bool:
         """
         Check if PDA accepts by final state.
@@ -85,63 +208,54 @@ class PDA(Automaton):
         """
         if self.start_state is None:
             return False
-        
-        # Initial configuration
-        initial_config = PDAConfiguration(
-            state=self.start_state,
-            remaining_input=input_string,
-            stack=[self.start_stack_symbol]
-        )
-        
-        # BFS queue
-        queue = [initial_config]
-        visited = set()
-        
-        while queue:
-            config = queue.pop(0)
-            
-            # Create a hashable representation
-            config_key = (config.state, config.remaining_input, tuple(config.stack))
-            if config_key in visited:
-                continue
-            visited.add(config_key)
-            
-            # Check acceptance: final state + empty input
-            if config.state in self.accept_states and not config.remaining_input:
+
+        # BFS over bare (state, position, stack) tuples — the
+        # dataclass wrapper is for display paths, not the search, so
+        # the hot loop skips its __init__ entirely. The remaining
+        # input is tracked as an integer offset into the original
+        # string rather than sliced per step, which would be O(n) per
+        # expansion. deque gives O(1) dequeues, and configurations are
+        # deduplicated *before* enqueueing, so each distinct key is
+        # pushed at most once and duplicates never occupy queue memory.
+        n = len(input_string)
+        initial = (self.start_state, 0,
+                   StackNode(self.start_stack_symbol, None))
+        queue = deque((initial,))
+        visited = {initial}
+        accept_states = self.accept_states
+        budget = self.MAX_CONFIGS
+
+        while queue and budget:
+            budget -= 1
+            state, pos, stack = queue.popleft()
+
+            # Check acceptance: final state + exhausted input
+            if pos == n and state in accept_states:
                 return True
-            
-            # Get current input symbol
-            current_symbol = config.remaining_input[0] if config.remaining_input else None
-            stack_top = config.stack[0] if config.stack else None
-            
-            if stack_top is None:
+
+            if stack is None:
                 continue
-            
+
             # Try all applicable transitions
-            transitions = self.get_applicable_transitions(config.state, current_symbol, stack_top)
-            
+            current_symbol = input_string[pos] if pos < n else None
+            transitions = self.get_applicable_transitions(state, current_symbol, stack.top)
+
             for trans in transitions:
-                # Create new configuration
-                new_stack = config.stack[1:]  # Pop
-                
-                # Push new symbols (in reverse order since we push to front)
-                for symbol in reversed(trans.stack_push):
-                    if symbol != 'ε':
-                        new_stack.insert(0, symbol)
-                
-                # Consume input if not epsilon transition
-                new_input = config.remaining_input
-                if trans.input_symbol != 'ε' and new_input:
-                    new_input = new_input[1:]
-                
-                new_config = PDAConfiguration(
-                    state=trans.to_state,
-                    remaining_input=new_input,
-                    stack=new_stack
-                )
-                
-                queue.append(new_config)
-        
+                # Pop the head and push the pre-reversed sequence;
+                # the untouched tail is shared with the parent
+                new_stack = stack.rest
+                for symbol in trans._push_rev:
+                    new_stack = StackNode(symbol, new_stack)
+
+                # Advance past the consumed symbol unless ε
+                new_pos = pos if trans.input_is_epsilon else pos + 1
+
+                new_key = (trans.to_state, new_pos, new_stack)
+                if new_key in visited:
+                    continue
+                visited.add(new_key)
+                queue.append(new_key)
+
         return False
     
     def simulate_step_by_step(self, input_string: str, max_steps: int = 100) -> List[Tuple[PDAConfiguration, Optional[PDATransition]]]:
@@ -152,53 +266,44 @@ class PDA(Automaton):
         if self.start_state is None:
             return []
         
-        initial_config = PDAConfiguration(
-            state=self.start_state,
-            remaining_input=input_string,
-            stack=[self.start_stack_symbol]
-        )
-        
-        path = [(initial_config, None)]
-        config = initial_config
-        
+        # Loop state lives in plain locals; the remaining input is an
+        # offset, sliced into a string only for the display snapshots
+        state = self.start_state
+        pos = 0
+        n = len(input_string)
+        stack = StackNode(self.start_stack_symbol, None)
+
+        path = [(PDAConfiguration(state, input_string, stack), None)]
+
         for _ in range(max_steps):
             # Check if accepted
-            if config.state in self.accept_states and not config.remaining_input:
+            if pos == n and state in self.accept_states:
                 break
-            
-            current_symbol = config.remaining_input[0] if config.remaining_input else None
-            stack_top = config.stack[0] if config.stack else None
-            
-            if stack_top is None:
+
+            if stack is None:
                 break
-            
+
             # Get applicable transitions (prefer non-epsilon if available)
-            transitions = self.get_applicable_transitions(config.state, current_symbol, stack_top)
-            
+            current_symbol = input_string[pos] if pos < n else None
+            transitions = self.get_applicable_transitions(state, current_symbol, stack.top)
+
             if not transitions:
                 break
-            
+
             # Pick first applicable transition (in real implementation, might explore all)
             trans = transitions[0]
-            
-            # Apply transition
-            new_stack = config.stack[1:]
-            for symbol in reversed(trans.stack_push):
-                if symbol != 'ε':
-                    new_stack.insert(0, symbol)
-            
-            new_input = config.remaining_input
-            if trans.input_symbol != 'ε' and new_input:
-                new_input = new_input[1:]
-            
-            config = PDAConfiguration(
-                state=trans.to_state,
-                remaining_input=new_input,
-                stack=new_stack
-            )
-            
-            path.append((config, trans))
-        
+
+            # Apply transition: pop the head, push the pre-reversed sequence
+            stack = stack.rest
+            for symbol in trans._push_rev:
+                stack = StackNode(symbol, stack)
+
+            if not trans.input_is_epsilon and pos < n:
+                pos += 1
+            state = trans.to_state
+
+            path.append((PDAConfiguration(state, input_string[pos:], stack), trans))
+
         return path
     
     def get_transition_function(self) -> List[Dict]:
@@ -1,75 +1,127 @@
-"""Text parser for automaton definitions."""
-
-from models.dfa import DFA
-from models.nfa import NFA, EpsilonNFA
-
-
-def parse_text_automaton(text: str):
-    """Parse text-based automaton definition.
-    
-    Expected format:
-        type: DFA|NFA|ENFA
-        states: q0, q1, q2
-        alphabet: a, b
-        start: q0
-        accept: q2
-        transitions:
-        q0, a -> q1
-        q1, b -> q2
-    """
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    
-    automaton_type = None
-    states = set()
-    alphabet = set()
-    start_state = None
-    accept_states = set()
-    transitions = {}
-    
-    in_transitions = False
-    
-    for line in lines:
-        if line.startswith('#'):  # Comment
-            continue
-            
-        if line.lower().startswith('type:'):
-            automaton_type = line.split(':', 1)[1].strip().upper()
-        elif line.lower().startswith('states:'):
-            states = set(s.strip() for s in line.split(':', 1)[1].split(','))
-        elif line.lower().startswith('alphabet:'):
-            alphabet = set(s.strip() for s in line.split(':', 1)[1].split(','))
-        elif line.lower().startswith('start:'):
-            start_state = line.split(':', 1)[1].strip()
-        elif line.lower().startswith('accept:'):
-            accept_states = set(s.strip() for s in line.split(':', 1)[1].split(','))
-        elif line.lower().startswith('transitions:'):
-            in_transitions = True
-        elif in_transitions and '->' in line:
-            parts = line.split('->')
-            from_part = parts[0].strip()
-            to_state = parts[1].strip()
-            
-            if ',' in from_part:
-                from_state, symbol = [p.strip() for p in from_part.split(',', 1)]
-            else:
-                raise ValueError(f"Invalid transition format: {line}")
-            
-            if automaton_type == 'DFA':
-                transitions[(from_state, symbol)] = to_state
-            else:  # NFA or ENFA
-                key = (from_state, symbol)
-                if key not in transitions:
-                    transitions[key] = set()
-                transitions[key].add(to_state)
-    
-    if not automaton_type:
-        raise ValueError("Automaton type not specified")
-    
-    if automaton_type == 'DFA':
-        return DFA(states, alphabet, transitions, start_state, accept_states)
-    elif automaton_type == 'NFA':
-        return NFA(states, alphabet, transitions, start_state, accept_states)
-    elif automaton_type in ('ENFA', 'EPSILON-NFA'):
-        return EpsilonNFA(states, alphabet, transitions, start_state, accept_states)
-    else:
-        raise ValueError(f"Unknown automaton type: {automaton_type}")
\ No newline at end of file
+"""Text parser for automaton definitions."""
+
+from sys import intern
+
+from models.dfa import DFA
+from models.nfa import NFA, EpsilonNFA
+
+
+def _set_type(rest, ctx):
+    ctx['type'] = rest.strip().upper()
+
+
+def _set_states(rest, ctx):
+    # Interned so the (state, symbol) keys hashed on every simulation
+    # step reuse one string object per name
+    ctx['states'] = [intern(s.strip()) for s in rest.split(',')]
+
+
+def _set_alphabet(rest, ctx):
+    ctx['alphabet'] = [s.strip() for s in rest.split(',')]
+
+
+def _set_start(rest, ctx):
+    ctx['start'] = intern(rest.strip())
+
+
+def _set_accept(rest, ctx):
+    ctx['accept'] = frozenset(intern(s.strip()) for s in rest.split(','))
+
+
+def _begin_transitions(rest, ctx):
+    ctx['in_transitions'] = True
+
+
+# One lowercased keyword lookup per header line instead of a chain of
+# lower()+startswith checks, each of which re-lowercases the line
+_HANDLERS = {
+    'type': _set_type,
+    'states': _set_states,
+    'alphabet': _set_alphabet,
+    'start': _set_start,
+    'accept': _set_accept,
+    'transitions': _begin_transitions,
+}
+
+_CLASSES = {
+    'DFA': DFA,
+    'NFA': NFA,
+    'ENFA': EpsilonNFA,
+    'EPSILON-NFA': EpsilonNFA,
+}
+
+
+def parse_text_automaton(text: str):
+    """Parse text-based automaton definition.
+
+    Expected format:
+        type: DFA|NFA|ENFA
+        states: q0, q1, q2
+        alphabet: a, b
+        start: q0
+        accept: q2
+        transitions:
+        q0, a -> q1
+        q1, b -> q2
+    """
+    ctx = {
+        'type': None,
+        'states': [],
+        'alphabet': [],
+        'start': None,
+        'accept': frozenset(),
+        'in_transitions': False,
+    }
+    transitions = []
+
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line or line.startswith('#'):  # Blank or comment
+            continue
+
+        key, sep, rest = line.partition(':')
+        if sep:
+            handler = _HANDLERS.get(key.strip().lower())
+            if handler:
+                handler(rest, ctx)
+                continue
+
+        if ctx['in_transitions'] and '->' in line:
+            from_part, _, to_state = line.partition('->')
+            from_part = from_part.strip()
+            to_state = to_state.strip()
+
+            if ',' in from_part:
+                from_state, symbol = [p.strip() for p in from_part.split(',', 1)]
+            else:
+                raise ValueError(f"Invalid transition format: {line}")
+
+            transitions.append((intern(from_state), symbol, intern(to_state)))
+
+    automaton_type = ctx['type']
+    if not automaton_type:
+        raise ValueError("Automaton type not specified")
+
+    cls = _CLASSES.get(automaton_type)
+    if cls is None:
+        raise ValueError(f"Unknown automaton type: {automaton_type}")
+
+    automaton = cls()
+    start_state = ctx['start']
+    accept_states = ctx['accept']
+
+    for name in ctx['states']:
+        automaton.add_state(name, is_accept=name in accept_states,
+                            is_start=name == start_state)
+
+    for from_state, symbol, to_state in transitions:
+        automaton.add_transition(from_state, to_state, symbol)
+
+    # Declared symbols without transitions still belong to the alphabet
+    automaton.alphabet.update(s for s in ctx['alphabet'] if s and s != 'ε')
+
+    if isinstance(automaton, NFA):
+        # Dropping dead states once here shrinks every later frontier
+        automaton = automaton.trimmed()
+
+    return automaton
@@ -1,84 +1,124 @@
 """Render automata using Graphviz."""
 
+from collections import defaultdict
 from typing import Union, Optional
 import graphviz
 from ..models.automaton import Automaton
-from ..models.pda import PDA
 from ..models.mealy_moore import MealyMachine, MooreMachine
 
 
-def render_automaton(automaton: Automaton, title: str = "Automaton") -> graphviz.Digraph:
+def _quote(text: str) -> str:
+    """Quote an identifier or label for DOT source."""
+    return '"' + (text.replace('\\', '\\\\')
+                      .replace('"', '\\"')
+                      .replace('\n', '\\n')) + '"'
+
+
+def render_automaton(automaton: Automaton, title: str = "Automaton") -> graphviz.Source:
     """
     Render an automaton as a Graphviz graph.
-    
+
     Args:
         automaton: The automaton to render
         title: Title for the graph
-    
+
     Returns:
-        Graphviz Digraph object
+        Graphviz Source object
+
+    The DOT source is accumulated as string fragments and joined once
+    rather than built through the Digraph node()/edge() API, which
+    pays validation and attribute-formatting overhead per call — for
+    big automata that per-element cost dominates the render.
     """
-    dot = graphviz.Digraph(comment=title)
-    dot.attr(rankdir='LR')
-    dot.attr('node', shape='circle')
-    
-    # Add invisible start node
-    dot.node('__start__', '', shape='none', width='0', height='0')
-    
+    parts = [
+        f'// {title}\n',
+        'digraph {\n',
+        '\trankdir=LR\n',
+        '\tnode [shape=circle]\n',
+        # Invisible start node
+        '\t__start__ [label="" shape=none width=0 height=0]\n',
+    ]
+    append = parts.append
+    is_moore = isinstance(automaton, MooreMachine)
+
     # Add states
     for state_name, state in automaton.states.items():
-        attrs = {}
-        
+        attrs = []
+
         if state.is_accept:
-            attrs['shape'] = 'doublecircle'
-        
+            attrs.append('shape=doublecircle')
+
         # For Moore machines, add output to state label
-        if isinstance(automaton, MooreMachine):
+        if is_moore:
             output = automaton.get_state_output(state_name)
             label = f"{state_name}\n{output}" if output else state_name
-            attrs['label'] = label
-        
-        dot.node(state_name, **attrs)
-        
+            attrs.append(f'label={_quote(label)}')
+
+        if attrs:
+            append(f'\t{_quote(state_name)} [{" ".join(attrs)}]\n')
+        else:
+            append(f'\t{_quote(state_name)}\n')
+
         # Add start arrow
         if state.is_start:
-            dot.edge('__start__', state_name)
-    
-    # Group transitions by (from, to) for combined labels
-    transition_labels = {}
-    
+            append(f'\t__start__ -> {_quote(state_name)}\n')
+
+    # Group transitions by (from, to) for combined labels. The label
+    # shape depends only on the automaton type, so pick the builder
+    # once instead of isinstance-testing per edge; PDA labels are
+    # already formatted into the symbol at add time.
+    if isinstance(automaton, MealyMachine):
+        make_label = lambda trans: f"{trans.symbol}/{trans.output}"
+    else:
+        make_label = lambda trans: trans.symbol
+
+    transition_labels = defaultdict(list)
     for trans in automaton.transitions:
-        key = (trans.from_state, trans.to_state)
-        
-        if isinstance(automaton, MealyMachine):
-            label = f"{trans.symbol}/{trans.output}"
-        elif isinstance(automaton, PDA):
-            # PDA transitions already have formatted labels
-            label = trans.symbol
-        else:
-            label = trans.symbol
-        
-        if key not in transition_labels:
-            transition_labels[key] = []
-        transition_labels[key].append(label)
-    
+        transition_labels[(trans.from_state, trans.to_state)].append(make_label(trans))
+
     # Add transitions with combined labels
     for (from_state, to_state), labels in transition_labels.items():
-        combined_label = ', '.join(labels)
-        dot.edge(from_state, to_state, label=combined_label)
-    
-    return dot
+        append(f'\t{_quote(from_state)} -> {_quote(to_state)} '
+               f'[label={_quote(", ".join(labels))}]\n')
+
+    append('}\n')
+    return graphviz.Source("".join(parts))
+
+
+def _structural_key(automaton: Automaton, title: str) -> tuple:
+    """Hashable snapshot of everything render_automaton looks at."""
+    outputs = (tuple(sorted(automaton.state_outputs.items()))
+               if isinstance(automaton, MooreMachine) else ())
+    return (
+        type(automaton).__name__,
+        title,
+        tuple(sorted((s.name, s.is_accept, s.is_start)
+                     for s in automaton.states.values())),
+        tuple((t.from_state, t.to_state, t.symbol, t.output)
+              for t in automaton.transitions),
+        outputs,
+    )
+
+
+# Built Digraphs keyed by structural snapshot, so exporting the same
+# automaton to several formats rebuilds the graph only once
+_graph_cache: dict = {}
 
 
 def export_graph(automaton: Automaton, filepath: str, format: str = 'png', title: str = "Automaton"):
     """
     Export automaton graph to file.
-    
+
     Args:
         automaton: The automaton to export
         filepath: Output file path (without extension)
         format: Output format ('png', 'svg', 'pdf', etc.)
         title: Graph title
     """
-    dot = render_automaton(automaton, title)
+    key = _structural_key(automaton, title)
+    dot = _graph_cache.get(key)
+    if dot is None:
+        if len(_graph_cache) >= 16:
+            _graph_cache.clear()
+        dot = _graph_cache[key] = render_automaton(automaton, title)
     dot.render(filepath, format=format, cleanup=True)
@@ -41,29 +41,27 @@ def simulate_automaton(automaton: Automaton, input_string: str) -> SimulationRes
 
 def _simulate_dfa(dfa: DFA, input_string: str) -> SimulationResult:
     """Simulate DFA."""
-    steps = dfa.simulate_step_by_step(input_string)
-    accepted = dfa.accepts(input_string)
+    accepted, steps = dfa.run(input_string)
     return SimulationResult(accepted=accepted, steps=steps)
 
 
 def _simulate_nfa(nfa: NFA, input_string: str) -> SimulationResult:
     """Simulate NFA."""
-    steps = nfa.simulate_step_by_step(input_string)
-    accepted = nfa.accepts(input_string)
+    accepted, steps = nfa.run(input_string)
     return SimulationResult(accepted=accepted, steps=steps)
 
 
 def _simulate_epsilon_nfa(enfa: EpsilonNFA, input_string: str) -> SimulationResult:
     """Simulate ε-NFA."""
-    steps = enfa.simulate_step_by_step(input_string)
-    accepted = enfa.accepts(input_string)
+    accepted, steps = enfa.run(input_string)
     return SimulationResult(accepted=accepted, steps=steps)
 
 
 def _simulate_pda(pda: PDA, input_string: str) -> SimulationResult:
     """Simulate PDA."""
-    steps = pda.simulate_step_by_step(input_string)
-    accepted = pda.accepts(input_string)
+    # One search decides acceptance and, when accepting, yields the
+    # accepting computation path rather than the greedy one
+    accepted, steps = pda.run(input_string)
     return SimulationResult(accepted=accepted, steps=steps)
 
 